@@ -8,20 +8,26 @@ simulation that goes beyond traditional user personas.
 Accompanying Article: "The Rise of Synthetic Citizens"
 """
 
-import sys
-import os
+import asyncio
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.columns import Columns
+from rich.live import Live
+from rich.text import Text
 from rich import box
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+try:
+    import uvloop  # Optional: faster event loop for the LLM fan-out
+except ImportError:
+    uvloop = None
 
 from simulacrum.agents.persona import (
     Citizen, 
     PsychologicalProfile,
+    TRAIT_NAMES,
+    trait_matrix,
     create_early_adopter,
     create_skeptic,
     create_anxious_user
@@ -29,6 +35,45 @@ from simulacrum.agents.persona import (
 
 console = Console()
 
+# Upper bound on in-flight LLM calls per scenario
+MAX_CONCURRENCY = 8
+
+# Table schemas, defined once and instantiated per scenario via new_table()
+RESULTS_TABLE = {
+    "title": "Behavioral Simulation Results",
+    "box": box.ROUNDED,
+    "columns": (
+        ("Citizen", {"style": "cyan", "no_wrap": True}),
+        ("Key Traits", {"style": "magenta"}),
+        ("Reaction", {"style": "green", "max_width": 50}),
+    ),
+}
+
+CRISIS_TABLE = {
+    "title": "Crisis Response Patterns",
+    "box": box.ROUNDED,
+    "columns": (
+        ("Citizen", {"style": "cyan"}),
+        ("Initial Reaction", {"style": "yellow", "max_width": 40}),
+        ("Follow-up Question", {"style": "red", "max_width": 40}),
+    ),
+}
+
+CONSISTENCY_TABLE = {
+    "title": "Cross-Context Behavioral Patterns",
+    "box": box.HEAVY_EDGE,
+    "columns": (
+        ("Scenario", {"style": "cyan"}),
+    ),
+}
+
+def new_table(schema: dict) -> Table:
+    """Build a fresh Table from a module-level schema (tables can't be shared once rendered)"""
+    table = Table(title=schema["title"], box=schema["box"])
+    for header, options in schema["columns"]:
+        table.add_column(header, **options)
+    return table
+
 def print_header():
     """Display welcome header"""
     console.print(Panel.fit(
@@ -49,9 +94,44 @@ def display_citizen_profile(citizen: Citizen):
     if citizen.core_values:
         profile_text += f"\n\n[dim]Core Values:[/dim] {', '.join(citizen.core_values)}"
     
-    return Panel(profile_text, border_style="blue", title=f"👤 {citizen.name}", box=box.ROUNDED)
+    # Parse the markup once; Columns measures each panel before rendering it
+    return Panel(Text.from_markup(profile_text), border_style="blue", title=f"👤 {citizen.name}", box=box.ROUNDED)
+
+async def stream_as_completed(jobs: list, max_concurrency: int = MAX_CONCURRENCY):
+    """
+    Run async jobs through a worker pool, yielding (index, result) as each finishes.
+    
+    Jobs are zero-argument coroutine functions. Workers pull them from a request
+    queue and push results onto an output queue, so callers can render each
+    result the moment it arrives instead of waiting for the slowest one.
+    """
+    q_req: asyncio.Queue = asyncio.Queue()
+    q_out: asyncio.Queue = asyncio.Queue()
+    
+    for idx, job in enumerate(jobs):
+        q_req.put_nowait((idx, job))
+    
+    async def worker():
+        while not q_req.empty():
+            idx, job = q_req.get_nowait()
+            try:
+                await q_out.put((idx, await job()))
+            except Exception as e:
+                await q_out.put((idx, e))
+    
+    workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrency, len(jobs)))]
+    
+    try:
+        for _ in range(len(jobs)):
+            idx, result = await q_out.get()
+            if isinstance(result, Exception):
+                raise result
+            yield idx, result
+    finally:
+        for task in workers:
+            task.cancel()
 
-def run_product_test():
+async def run_product_test():
     """Scenario 1: Testing a financial product announcement"""
     console.print("\n[bold yellow]═══ SCENARIO 1: Product Launch Testing ═══[/bold yellow]\n")
     
@@ -79,30 +159,31 @@ def run_product_test():
     # Collect reactions
     console.print("\n[bold]Collecting Reactions...[/bold]\n")
     
-    results_table = Table(title="Behavioral Simulation Results", box=box.ROUNDED)
-    results_table.add_column("Citizen", style="cyan", no_wrap=True)
-    results_table.add_column("Key Traits", style="magenta")
-    results_table.add_column("Reaction", style="green", max_width=50)
-    
-    with console.status("[bold green]Simulating reactions...[/bold green]"):
-        for citizen in citizens:
-            reaction = citizen.think(
-                stimulus=marketing_message,
-                context="This is a new financial product being marketed to you"
-            )
-            
-            # Extract key traits for display
-            key_traits = f"Open: {citizen.traits.openness:.1f}\n"
-            key_traits += f"Neuro: {citizen.traits.neuroticism:.1f}\n"
-            key_traits += f"Consc: {citizen.traits.conscientiousness:.1f}"
-            
-            results_table.add_row(citizen.name, key_traits, reaction)
+    results_table = new_table(RESULTS_TABLE)
     
-    console.print(results_table)
+    # Key trait labels for the whole panel, formatted in one vectorized pass
+    traits = trait_matrix(citizens)
+    key_traits = np.char.add(np.char.add(
+        np.char.mod("Open: %.1f\n", traits[:, TRAIT_NAMES.index("openness")]),
+        np.char.mod("Neuro: %.1f\n", traits[:, TRAIT_NAMES.index("neuroticism")])),
+        np.char.mod("Consc: %.1f", traits[:, TRAIT_NAMES.index("conscientiousness")]))
+    
+    jobs = [
+        lambda c=citizen: c.athink(
+            stimulus=marketing_message,
+            context="This is a new financial product being marketed to you"
+        )
+        for citizen in citizens
+    ]
+    
+    # Rows appear as each citizen finishes reacting
+    with Live(results_table, console=console, refresh_per_second=4):
+        async for idx, reaction in stream_as_completed(jobs):
+            results_table.add_row(citizens[idx].name, str(key_traits[idx]), reaction)
     
     return citizens
 
-def run_crisis_communication_test(citizens: list):
+async def run_crisis_communication_test(citizens: list):
     """Scenario 2: Testing crisis communication"""
     console.print("\n\n[bold yellow]═══ SCENARIO 2: Crisis Communication Testing ═══[/bold yellow]\n")
     
@@ -116,28 +197,28 @@ def run_crisis_communication_test(citizens: list):
     
     console.print("\n[bold]Testing same message with same participants:[/bold]\n")
     
-    crisis_table = Table(title="Crisis Response Patterns", box=box.ROUNDED)
-    crisis_table.add_column("Citizen", style="cyan")
-    crisis_table.add_column("Initial Reaction", style="yellow", max_width=40)
-    crisis_table.add_column("Follow-up Question", style="red", max_width=40)
-    
-    with console.status("[bold green]Simulating crisis responses...[/bold green]"):
-        for citizen in citizens:
-            # Initial reaction
-            initial = citizen.think(
-                stimulus=crisis_message,
-                context="You just received this notification about your investment service"
-            )
-            
-            # Follow-up to test memory/consistency
-            followup_prompt = "What are you going to do next?"
-            followup = citizen.think(followup_prompt)
-            
-            crisis_table.add_row(citizen.name, initial, followup)
+    crisis_table = new_table(CRISIS_TABLE)
+    
+    async def respond(citizen: Citizen):
+        # Initial reaction
+        initial = await citizen.athink(
+            stimulus=crisis_message,
+            context="You just received this notification about your investment service"
+        )
+        
+        # Follow-up to test memory/consistency (needs the initial reaction in memory)
+        followup_prompt = "What are you going to do next?"
+        followup = await citizen.athink(followup_prompt)
+        
+        return initial, followup
     
-    console.print(crisis_table)
+    jobs = [lambda c=citizen: respond(c) for citizen in citizens]
+    
+    with Live(crisis_table, console=console, refresh_per_second=4):
+        async for idx, (initial, followup) in stream_as_completed(jobs):
+            crisis_table.add_row(citizens[idx].name, initial, followup)
 
-def run_comparative_analysis(citizens: list):
+async def run_comparative_analysis(citizens: list):
     """Scenario 3: Show behavioral consistency across contexts"""
     console.print("\n\n[bold yellow]═══ SCENARIO 3: Behavioral Consistency Analysis ═══[/bold yellow]\n")
     
@@ -147,24 +228,25 @@ def run_comparative_analysis(citizens: list):
         ("Privacy Update", "We're now sharing anonymized trading data with research partners.")
     ]
     
-    consistency_table = Table(title="Cross-Context Behavioral Patterns", box=box.HEAVY_EDGE)
-    consistency_table.add_column("Scenario", style="cyan")
+    consistency_table = new_table(CONSISTENCY_TABLE)
     
     for citizen in citizens:
         consistency_table.add_column(f"{citizen.name}\n({citizen.role})", style="magenta", max_width=30)
     
-    for scenario_name, scenario_text in test_scenarios:
-        row_data = [scenario_name]
-        
-        with console.status(f"[bold green]Testing: {scenario_name}...[/bold green]"):
-            for citizen in citizens:
-                reaction = citizen.think(scenario_text, context="Product update notification")
+    # Scenarios stay sequential so each reaction can draw on the previous ones in memory
+    with Live(consistency_table, console=console, refresh_per_second=4):
+        for scenario_name, scenario_text in test_scenarios:
+            jobs = [
+                lambda c=citizen: c.athink(scenario_text, context="Product update notification")
+                for citizen in citizens
+            ]
+            
+            reactions = [None] * len(citizens)
+            async for idx, reaction in stream_as_completed(jobs):
                 # Truncate for table display
-                row_data.append(reaction[:100] + "..." if len(reaction) > 100 else reaction)
-        
-        consistency_table.add_row(*row_data)
-    
-    console.print(consistency_table)
+                reactions[idx] = reaction[:100] + "..." if len(reaction) > 100 else reaction
+            
+            consistency_table.add_row(scenario_name, *reactions)
 
 def display_insights():
     """Display key insights from the simulation"""
@@ -184,13 +266,13 @@ def display_insights():
     console.print("\n[dim]Traditional personas would give you demographics.\n"
                  "Synthetic Citizens give you behavioral predictions.[/dim]\n")
 
-def main():
+async def main():
     print_header()
     
     # Run scenarios
-    citizens = run_product_test()
-    run_crisis_communication_test(citizens)
-    run_comparative_analysis(citizens)
+    citizens = await run_product_test()
+    await run_crisis_communication_test(citizens)
+    await run_comparative_analysis(citizens)
     
     # Show insights
     display_insights()
@@ -201,4 +283,7 @@ def main():
         console.print(f"\n[cyan]{citizen.name}:[/cyan] {citizen.get_memory_summary()}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file
@@ -8,20 +8,18 @@ through structured protocols to reach collective decisions.
 Accompanying Article: "The Elegance of the Swarm - Distributed Agentic Protocols"
 """
 
-import sys
-import os
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.live import Live
 from rich import box
-from rich.columns import Columns
-
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from simulacrum.agents.persona import (
     Citizen,
     PsychologicalProfile,
+    TRAIT_NAMES,
+    trait_matrix,
     create_early_adopter,
     create_skeptic,
     create_anxious_user
@@ -31,6 +29,83 @@ from simulacrum.protocols.jury import JuryProtocol, simulate_trial
 
 console = Console()
 
+# Panel composition, built once at import: a row per citizen,
+# trait columns in TRAIT_NAMES order (O, C, E, A, N)
+PANEL_TRAITS = np.array([
+    # Early adopters (2)
+    [0.9, 0.4, 0.7, 0.6, 0.2],
+    [0.85, 0.5, 0.8, 0.5, 0.15],
+    
+    # Skeptics (2)
+    [0.2, 0.9, 0.3, 0.4, 0.4],
+    [0.25, 0.85, 0.4, 0.3, 0.5],
+    
+    # Anxious users (1)
+    [0.4, 0.6, 0.3, 0.7, 0.9],
+    
+    # Balanced (2)
+    [0.5, 0.5, 0.5, 0.5, 0.5],
+    [0.55, 0.6, 0.6, 0.6, 0.4],
+])
+PANEL_TRAITS.setflags(write=False)
+
+# Default profile for jurors padding the panel out to 12 (O, C, E, A, N)
+DEFAULT_JUROR_TRAITS = np.array([0.5, 0.6, 0.5, 0.6, 0.4])
+DEFAULT_JUROR_TRAITS.setflags(write=False)
+
+PANEL_ROLES = ("Tech Lead", "Product Manager", "Risk Analyst", "Compliance Officer",
+               "Customer Support", "Engineer", "Designer")
+PANEL_NAMES = ("Alex", "Jordan", "Barbara", "Diana", "Charlie", "Sam", "Taylor")
+
+# Table schemas, defined once and instantiated per scenario via new_table()
+TEAM_TABLE = {
+    "title": "Product Team",
+    "box": box.SIMPLE,
+    "columns": (
+        ("Name", {"style": "cyan"}),
+        ("Role", {"style": "magenta"}),
+        ("Personality", {"style": "yellow"}),
+    ),
+}
+
+VOTING_RESULTS_TABLE = {
+    "title": "Voting Results",
+    "box": box.ROUNDED,
+    "columns": (
+        ("Option", {"style": "cyan"}),
+        ("Votes", {"style": "magenta"}),
+        ("Supporters", {"style": "yellow", "max_width": 30}),
+    ),
+}
+
+COMPARISON_TABLE = {
+    "title": "Consensus Mechanism Comparison",
+    "box": box.HEAVY,
+    "columns": (
+        ("Mechanism", {"style": "cyan"}),
+        ("Winner", {"style": "green"}),
+        ("Confidence", {"style": "yellow"}),
+        ("Decisive?", {"style": "magenta"}),
+    ),
+}
+
+TRAJECTORY_TABLE = {
+    "title": "Vote Trajectory",
+    "box": box.SIMPLE,
+    "columns": (
+        ("Round", {"style": "cyan"}),
+        ("Guilty", {"style": "red"}),
+        ("Not Guilty", {"style": "green"}),
+    ),
+}
+
+def new_table(schema: dict) -> Table:
+    """Build a fresh Table from a module-level schema (tables can't be shared once rendered)"""
+    table = Table(title=schema["title"], box=schema["box"])
+    for header, options in schema["columns"]:
+        table.add_column(header, **options)
+    return table
+
 def print_header():
     """Display welcome header"""
     console.print(Panel.fit(
@@ -44,37 +119,14 @@ def create_diverse_panel(n: int = 7) -> list:
     """Create a diverse panel of citizens for voting."""
     console.print(f"\n[bold yellow]Creating diverse panel of {n} citizens...[/bold yellow]")
     
-    profiles = [
-        # Early adopters (2)
-        PsychologicalProfile(openness=0.9, conscientiousness=0.4, neuroticism=0.2, extraversion=0.7, agreeableness=0.6),
-        PsychologicalProfile(openness=0.85, conscientiousness=0.5, neuroticism=0.15, extraversion=0.8, agreeableness=0.5),
-        
-        # Skeptics (2)
-        PsychologicalProfile(openness=0.2, conscientiousness=0.9, neuroticism=0.4, extraversion=0.3, agreeableness=0.4),
-        PsychologicalProfile(openness=0.25, conscientiousness=0.85, neuroticism=0.5, extraversion=0.4, agreeableness=0.3),
-        
-        # Anxious users (1)
-        PsychologicalProfile(openness=0.4, conscientiousness=0.6, neuroticism=0.9, extraversion=0.3, agreeableness=0.7),
-        
-        # Balanced (2)
-        PsychologicalProfile(openness=0.5, conscientiousness=0.5, neuroticism=0.5, extraversion=0.5, agreeableness=0.5),
-        PsychologicalProfile(openness=0.55, conscientiousness=0.6, neuroticism=0.4, extraversion=0.6, agreeableness=0.6),
-    ]
-    
-    roles = ["Tech Lead", "Product Manager", "Risk Analyst", "Compliance Officer", 
-             "Customer Support", "Engineer", "Designer"]
-    names = ["Alex", "Jordan", "Barbara", "Diana", "Charlie", "Sam", "Taylor"]
-    
-    citizens = []
-    for i in range(min(n, len(profiles))):
-        citizen = Citizen(
-            name=names[i],
-            role=roles[i],
-            traits=profiles[i]
+    return [
+        Citizen(
+            name=PANEL_NAMES[i],
+            role=PANEL_ROLES[i],
+            traits=PsychologicalProfile.from_vector(PANEL_TRAITS[i])
         )
-        citizens.append(citizen)
-    
-    return citizens
+        for i in range(min(n, len(PANEL_TRAITS)))
+    ]
 
 def scenario_1_product_decision():
     """Scenario 1: Product team voting on a feature decision"""
@@ -86,14 +138,17 @@ def scenario_1_product_decision():
     team = create_diverse_panel(n=7)
     
     # Show team composition
-    team_table = Table(title="Product Team", box=box.SIMPLE)
-    team_table.add_column("Name", style="cyan")
-    team_table.add_column("Role", style="magenta")
-    team_table.add_column("Personality", style="yellow")
+    team_table = new_table(TEAM_TABLE)
+    
+    # Format O, C, N for the whole team in one vectorized pass
+    traits = trait_matrix(team)
+    personalities = np.char.add(np.char.add(
+        np.char.mod("O:%.1f ", traits[:, TRAIT_NAMES.index("openness")]),
+        np.char.mod("C:%.1f ", traits[:, TRAIT_NAMES.index("conscientiousness")])),
+        np.char.mod("N:%.1f", traits[:, TRAIT_NAMES.index("neuroticism")]))
     
-    for citizen in team:
-        personality = f"O:{citizen.traits.openness:.1f} C:{citizen.traits.conscientiousness:.1f} N:{citizen.traits.neuroticism:.1f}"
-        team_table.add_row(citizen.name, citizen.role, personality)
+    for citizen, personality in zip(team, personalities):
+        team_table.add_row(citizen.name, citizen.role, str(personality))
     
     console.print(team_table)
     
@@ -116,10 +171,7 @@ def scenario_1_product_decision():
         result = quick_vote(team, question, options, ConsensusType.SIMPLE_MAJORITY)
     
     # Display results
-    results_table = Table(title="Voting Results", box=box.ROUNDED)
-    results_table.add_column("Option", style="cyan")
-    results_table.add_column("Votes", style="magenta")
-    results_table.add_column("Supporters", style="yellow", max_width=30)
+    results_table = new_table(VOTING_RESULTS_TABLE)
     
     for option in options:
         votes = result.vote_counts.get(option, 0)
@@ -152,11 +204,7 @@ def scenario_2_consensus_types(team):
         ConsensusType.PLURALITY
     ]
     
-    comparison_table = Table(title="Consensus Mechanism Comparison", box=box.HEAVY)
-    comparison_table.add_column("Mechanism", style="cyan")
-    comparison_table.add_column("Winner", style="green")
-    comparison_table.add_column("Confidence", style="yellow")
-    comparison_table.add_column("Decisive?", style="magenta")
+    comparison_table = new_table(COMPARISON_TABLE)
     
     for consensus_type in consensus_types:
         with console.status(f"[bold green]Testing {consensus_type.value}...[/bold green]"):
@@ -183,19 +231,18 @@ def scenario_3_jury_deliberation():
     # Create jury
     jury = create_diverse_panel(n=12)
     
-    # Extend to 12 if needed
-    while len(jury) < 12:
-        jury.append(Citizen(
-            name=f"Juror{len(jury)+1}",
+    # Extend to 12 with default jurors, all constructed in one pass
+    first_juror = len(jury) + 1
+    padding = np.tile(DEFAULT_JUROR_TRAITS, (12 - len(jury), 1))
+    jury.extend(
+        Citizen(
+            name=f"Juror{number}",
             role="Juror",
-            traits=PsychologicalProfile(
-                openness=0.5,
-                conscientiousness=0.6,
-                neuroticism=0.4,
-                extraversion=0.5,
-                agreeableness=0.6
-            )
-        ))
+            traits=PsychologicalProfile.from_vector(row),
+            share_responses=True  # identical stand-ins: one LLM call per round
+        )
+        for number, row in enumerate(padding, start=first_juror)
+    )
     
     console.print(f"[bold]Jury enrolled:[/bold] {len(jury)} citizens\n")
     
@@ -226,13 +273,26 @@ No fingerprints were found on the vehicle. The car was found abandoned 2 miles a
     # Run jury deliberation
     console.print("\n[bold green]Beginning jury deliberation...[/bold green]\n")
     
-    with console.status("[bold green]Jury deliberating through multiple rounds...[/bold green]"):
+    # Stream the vote trajectory, one row per round as it completes
+    trajectory_table = new_table(TRAJECTORY_TABLE)
+    
+    def add_round(round_num, votes):
+        round_label = "Initial" if round_num == 0 else f"After Round {round_num}"
+        trajectory_table.add_row(
+            round_label,
+            str(votes.get("Guilty", 0)),
+            str(votes.get("Not Guilty", 0))
+        )
+    
+    with Live(trajectory_table, console=console, refresh_per_second=4):
         verdict = simulate_trial(
             agents=jury,
             case_summary=case_summary,
             charges=charges,
             evidence=evidence,
-            max_rounds=3
+            max_rounds=3,
+            on_round_complete=add_round,
+            verbose=False
         )
     
     # Display verdict
@@ -242,23 +302,6 @@ No fingerprints were found on the vehicle. The car was found abandoned 2 miles a
     console.print(f"[bold]Rounds of deliberation:[/bold] {verdict.rounds_taken}")
     console.print(f"[bold]Consensus reached:[/bold] {'Yes' if verdict.consensus_reached else 'No (Hung Jury)'}")
     
-    # Show vote trajectory
-    trajectory_table = Table(title="Vote Trajectory", box=box.SIMPLE)
-    trajectory_table.add_column("Round", style="cyan")
-    trajectory_table.add_column("Guilty", style="red")
-    trajectory_table.add_column("Not Guilty", style="green")
-    
-    for i, votes in enumerate(verdict.vote_trajectory):
-        round_label = "Initial" if i == 0 else f"After Round {i}"
-        trajectory_table.add_row(
-            round_label,
-            str(votes.get("Guilty", 0)),
-            str(votes.get("Not Guilty", 0))
-        )
-    
-    console.print("\n")
-    console.print(trajectory_table)
-    
     if verdict.consensus_reached:
         console.print(f"\n[bold green]✓ The jury reached a unanimous decision of '{verdict.verdict}'[/bold green]")
     else:
@@ -297,4 +340,4 @@ def main():
     console.print("[dim]Where agents don't just collaborate—they transact.[/dim]\n")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
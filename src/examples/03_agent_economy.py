@@ -8,24 +8,26 @@ transactions: buying, selling, negotiating, and forming markets.
 Accompanying Article: "The Agent-to-Agent Economy"
 """
 
-import sys
 import os
-from rich.console import Console
+from contextlib import nullcontext
+from functools import lru_cache
+from operator import attrgetter
+
+import numpy as np
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
 from rich import box
-from rich.columns import Columns
-
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from simulacrum.agents.persona import (
     PsychologicalProfile,
+    TRAIT_NAMES,
+    trait_matrix
 )
 from simulacrum.economy.wallet import (
     create_economic_citizen,
-    Wallet,
-    calculate_utility
+    calculate_utility_batch
 )
 from simulacrum.economy.negotiation import (
     negotiate_price,
@@ -36,7 +38,55 @@ from simulacrum.economy.marketplace import (
     analyze_price_sensitivity
 )
 
-console = Console()
+# Batch mode (CI, profiling): SIMULACRUM_QUIET=1 silences output and spinners
+QUIET = os.getenv("SIMULACRUM_QUIET", "") not in ("", "0")
+
+console = Console(quiet=QUIET)
+
+# C-level attribute access for the per-agent columns and name lists
+_name_and_role = attrgetter("name", "role")
+_name = attrgetter("name")
+_balance = attrgetter("wallet.balance")
+
+
+@lru_cache(maxsize=None)
+def markup(text: str) -> Text:
+    """Parse (and highlight) a constant markup string once, as console.print would."""
+    return console.render_str(text)
+
+
+def status(message: str):
+    """Spinner while agents work; a no-op in quiet mode (no refresh thread)."""
+    return nullcontext() if QUIET else console.status(message)
+
+
+# Column of each negotiating role in the offers matrix
+ROLE_IDX = {"seller": 0, "buyer": 1}
+
+# (name, role, initial balance) per economic agent; traits are the matching
+# row of ECONOMIC_AGENT_TRAITS, columns ordered as TRAIT_NAMES
+ECONOMIC_AGENT_SPECS = [
+    ("Alex", "Tech Innovator", 2000),        # High openness - values innovation, willing to pay premium
+    ("Barbara", "CFO", 3000),                # High conscientiousness - careful buyer, values quality
+    ("Charlie", "Risk Analyst", 1500),       # High neuroticism - risk averse, cautious spender
+    ("Diana", "Partnership Manager", 2500),  # High agreeableness - quick to agree, fair negotiator
+]
+ECONOMIC_AGENT_TRAITS = np.array([
+    [0.9, 0.6, 0.7, 0.6, 0.3],
+    [0.4, 0.9, 0.5, 0.6, 0.4],
+    [0.5, 0.7, 0.4, 0.7, 0.9],
+    [0.6, 0.6, 0.8, 0.9, 0.3],
+])
+ECONOMIC_AGENT_TRAITS.flags.writeable = False
+
+# Candidate "key traits" in tie-break order, with their display labels
+KEY_TRAITS = ("openness", "conscientiousness", "neuroticism", "agreeableness", "extraversion")
+KEY_TRAIT_COLUMNS = [TRAIT_NAMES.index(trait) for trait in KEY_TRAITS]
+KEY_TRAIT_LABELS = np.array(["Open", "Conscientious", "Neurotic", "Agreeable", "Extraverted"])
+
+# Full-width demand bar; rows take a prefix slice of it
+DEMAND_BAR_WIDTH = 20
+DEMAND_BAR = "█" * DEMAND_BAR_WIDTH
 
 
 def print_header():
@@ -51,64 +101,14 @@ def print_header():
 
 def create_economic_agents():
     """Create agents with economic capabilities."""
-    console.print("\n[bold yellow]Creating economic agents...[/bold yellow]")
-    
     agents = [
-        # High openness - values innovation, willing to pay premium
-        create_economic_citizen(
-            name="Alex",
-            role="Tech Innovator",
-            traits=PsychologicalProfile(
-                openness=0.9,
-                conscientiousness=0.6,
-                extraversion=0.7,
-                agreeableness=0.6,
-                neuroticism=0.3
-            ),
-            initial_balance=2000
-        ),
-        
-        # High conscientiousness - careful buyer, values quality
         create_economic_citizen(
-            name="Barbara",
-            role="CFO",
-            traits=PsychologicalProfile(
-                openness=0.4,
-                conscientiousness=0.9,
-                extraversion=0.5,
-                agreeableness=0.6,
-                neuroticism=0.4
-            ),
-            initial_balance=3000
-        ),
-        
-        # High neuroticism - risk averse, cautious spender
-        create_economic_citizen(
-            name="Charlie",
-            role="Risk Analyst",
-            traits=PsychologicalProfile(
-                openness=0.5,
-                conscientiousness=0.7,
-                extraversion=0.4,
-                agreeableness=0.7,
-                neuroticism=0.9
-            ),
-            initial_balance=1500
-        ),
-        
-        # High agreeableness - quick to agree, fair negotiator
-        create_economic_citizen(
-            name="Diana",
-            role="Partnership Manager",
-            traits=PsychologicalProfile(
-                openness=0.6,
-                conscientiousness=0.6,
-                extraversion=0.8,
-                agreeableness=0.9,
-                neuroticism=0.3
-            ),
-            initial_balance=2500
+            name=name,
+            role=role,
+            traits=PsychologicalProfile.from_vector(traits),
+            initial_balance=balance
         )
+        for (name, role, balance), traits in zip(ECONOMIC_AGENT_SPECS, ECONOMIC_AGENT_TRAITS)
     ]
     
     # Display agents
@@ -118,33 +118,32 @@ def create_economic_agents():
     agent_table.add_column("Balance", style="green")
     agent_table.add_column("Key Trait", style="yellow")
     
-    for agent in agents:
-        traits = agent.traits
-        key_trait = max(
-            [("Open", traits.openness),
-             ("Conscientious", traits.conscientiousness),
-             ("Neurotic", traits.neuroticism),
-             ("Agreeable", traits.agreeableness),
-             ("Extraverted", traits.extraversion)],
-            key=lambda x: x[1]
-        )[0]
-        
-        agent_table.add_row(
-            agent.name,
-            agent.role,
-            f"{agent.wallet.balance:.0f} credits",
-            key_trait
-        )
+    # Strongest trait per agent, read from the built agents, in one argmax
+    # (first column wins ties)
+    key_traits = KEY_TRAIT_LABELS[trait_matrix(agents)[:, KEY_TRAIT_COLUMNS].argmax(axis=1)]
+    
+    balances = np.fromiter(map(_balance, agents), dtype=float, count=len(agents))
+    
+    for (name, role), balance, key_trait in zip(
+        map(_name_and_role, agents),
+        np.char.mod("%.0f credits", balances),
+        key_traits
+    ):
+        agent_table.add_row(name, role, balance, key_trait)
     
-    console.print(agent_table)
+    console.print(Group(
+        markup("\n[bold yellow]Creating economic agents...[/bold yellow]"),
+        agent_table
+    ))
     return agents
 
 
 def scenario_1_utility_valuation(agents):
     """Scenario 1: How agents value the same product differently"""
-    console.print("\n[bold yellow]═══ SCENARIO 1: Differential Valuation ═══[/bold yellow]\n")
-    
-    console.print("All agents evaluate the same product: 'AI-Powered Analytics Platform'\n")
+    renderables = [
+        markup("\n[bold yellow]═══ SCENARIO 1: Differential Valuation ═══[/bold yellow]\n"),
+        markup("All agents evaluate the same product: 'AI-Powered Analytics Platform'\n")
+    ]
     
     # Product context
     item = "AI-Powered Analytics Platform"
@@ -158,11 +157,9 @@ def scenario_1_utility_valuation(agents):
         "description": "Cutting-edge analytics with ML capabilities"
     }
     
-    # Calculate utilities
-    valuations = []
-    for agent in agents:
-        utility = calculate_utility(agent, item, base_value, context)
-        valuations.append((agent.name, agent.role, utility))
+    # Calculate utilities for every agent at once
+    utilities = calculate_utility_batch(agents, item, base_value, context)
+    valuations = [(agent.name, agent.role, utility) for agent, utility in zip(agents, utilities)]
     
     # Display results
     valuation_table = Table(title="Agent Valuations (Willingness-to-Pay)", box=box.ROUNDED)
@@ -171,45 +168,46 @@ def scenario_1_utility_valuation(agents):
     valuation_table.add_column("Valuation", style="green")
     valuation_table.add_column("Premium vs Base", style="yellow")
     
-    for name, role, utility in valuations:
-        premium = utility - base_value
-        premium_pct = (premium / base_value) * 100
-        
-        valuation_table.add_row(
-            name,
-            role,
-            f"{utility:.0f} credits",
-            f"+{premium:.0f} ({premium_pct:+.0f}%)"
-        )
+    premiums = utilities - base_value
+    premium_pcts = (premiums / base_value) * 100
+    value_cells = np.char.mod("%.0f credits", utilities)
+    premium_cells = np.char.add(
+        np.char.mod("+%.0f (", premiums),
+        np.char.mod("%+.0f%%)", premium_pcts)
+    )
     
-    console.print(valuation_table)
+    for (name, role, _), value, premium in zip(valuations, value_cells, premium_cells):
+        valuation_table.add_row(name, role, value, premium)
     
-    console.print("\n[bold]Insight:[/bold] Same product, different values based on personality!")
-    console.print("[dim]- High openness (Alex) values innovation → highest valuation\n- High neuroticism (Charlie) fears risk → lowest valuation\n- Quality-focused (Barbara) willing to pay for excellence[/dim]\n")
+    renderables += [
+        valuation_table,
+        markup("\n[bold]Insight:[/bold] Same product, different values based on personality!"),
+        markup("[dim]- High openness (Alex) values innovation → highest valuation\n- High neuroticism (Charlie) fears risk → lowest valuation\n- Quality-focused (Barbara) willing to pay for excellence[/dim]\n")
+    ]
+    console.print(Group(*renderables))
 
 
 def scenario_2_price_negotiation(agents):
     """Scenario 2: Two agents negotiate a price"""
-    console.print("\n[bold yellow]═══ SCENARIO 2: Price Negotiation ═══[/bold yellow]\n")
-    
     # Setup: Diana (seller) and Alex (buyer)
     seller = agents[3]  # Diana - high agreeableness
     buyer = agents[0]   # Alex - high openness
     
-    console.print(f"[bold]{seller.name}[/bold] (seller) negotiates with [bold]{buyer.name}[/bold] (buyer)")
-    console.print(f"Product: Custom Software License\n")
-    
     # Negotiation parameters
     item = "Custom Software License"
     seller_reserve = 800  # Won't sell below this
     buyer_max = 1500      # Won't pay above this
     
-    console.print(f"[dim]Seller's minimum: {seller_reserve} credits\nBuyer's maximum: {buyer_max} credits\nZOPA (Zone of Possible Agreement): {buyer_max - seller_reserve} credits[/dim]\n")
-    
-    console.print("[bold green]Negotiation in progress...[/bold green]\n")
+    console.print(Group(
+        markup("\n[bold yellow]═══ SCENARIO 2: Price Negotiation ═══[/bold yellow]\n"),
+        f"[bold]{seller.name}[/bold] (seller) negotiates with [bold]{buyer.name}[/bold] (buyer)",
+        f"Product: Custom Software License\n",
+        f"[dim]Seller's minimum: {seller_reserve} credits\nBuyer's maximum: {buyer_max} credits\nZOPA (Zone of Possible Agreement): {buyer_max - seller_reserve} credits[/dim]\n",
+        markup("[bold green]Negotiation in progress...[/bold green]\n")
+    ))
     
     # Run negotiation
-    with console.status("[bold green]Agents negotiating...[/bold green]"):
+    with status("[bold green]Agents negotiating...[/bold green]"):
         result = negotiate_price(
             buyer=buyer,
             seller=seller,
@@ -226,65 +224,67 @@ def scenario_2_price_negotiation(agents):
     trajectory_table.add_column("Buyer Bid", style="green")
     trajectory_table.add_column("Gap", style="yellow")
     
-    # Group offers by round
-    rounds_data = {}
+    # Lay offers out as (round, role); NaN marks a side that didn't move that round
+    num_rounds = result.offers[-1].round + 1 if result.offers else 0
+    offers_matrix = np.full((num_rounds, len(ROLE_IDX)), np.nan)
     for offer in result.offers:
-        if offer.round not in rounds_data:
-            rounds_data[offer.round] = {}
-        rounds_data[offer.round][offer.role] = offer.price
-    
-    for round_num in sorted(rounds_data.keys()):
-        round_offers = rounds_data[round_num]
-        seller_ask = round_offers.get("seller", "-")
-        buyer_bid = round_offers.get("buyer", "-")
-        
-        if isinstance(seller_ask, float) and isinstance(buyer_bid, float):
-            gap = seller_ask - buyer_bid
-            trajectory_table.add_row(
-                str(round_num),
-                f"{seller_ask:.0f}",
-                f"{buyer_bid:.0f}",
-                f"{gap:.0f}"
-            )
+        offers_matrix[offer.round, ROLE_IDX[offer.role]] = offer.price
     
-    console.print(trajectory_table)
+    # Only rounds where both sides quoted get a row
+    complete_rounds = np.flatnonzero(~np.isnan(offers_matrix).any(axis=1))
+    asks, bids = offers_matrix[complete_rounds].T
+    
+    for row in zip(
+        complete_rounds.astype(str),
+        np.char.mod("%.0f", asks),
+        np.char.mod("%.0f", bids),
+        np.char.mod("%.0f", asks - bids)
+    ):
+        trajectory_table.add_row(*row)
+    
+    renderables = [trajectory_table]
     
     # Display result
     if result.outcome == NegotiationOutcome.SUCCESS:
-        console.print(f"\n[bold green]✓ Deal Reached![/bold green]")
-        console.print(f"[bold]Final Price:[/bold] {result.final_price:.0f} credits")
-        console.print(f"[bold]Rounds:[/bold] {result.rounds_taken}")
-        console.print(f"\n[dim]Seller gained: {result.premium:.0f} above minimum\nBuyer saved: {result.savings:.0f} below maximum[/dim]")
+        renderables += [
+            f"\n[bold green]✓ Deal Reached![/bold green]",
+            f"[bold]Final Price:[/bold] {result.final_price:.0f} credits",
+            f"[bold]Rounds:[/bold] {result.rounds_taken}",
+            f"\n[dim]Seller gained: {result.premium:.0f} above minimum\nBuyer saved: {result.savings:.0f} below maximum[/dim]"
+        ]
     else:
-        console.print(f"\n[bold red]✗ No Deal[/bold red]")
-        console.print(f"[bold]Outcome:[/bold] {result.outcome.value}")
-    
-    console.print("\n[bold]Insight:[/bold] Personality shapes negotiation strategy!")
-    console.print("[dim]- High agreeableness (Diana) makes larger concessions\n- High openness (Alex) flexible and creative in offers[/dim]\n")
+        renderables += [
+            f"\n[bold red]✗ No Deal[/bold red]",
+            f"[bold]Outcome:[/bold] {result.outcome.value}"
+        ]
+    
+    renderables += [
+        markup("\n[bold]Insight:[/bold] Personality shapes negotiation strategy!"),
+        markup("[dim]- High agreeableness (Diana) makes larger concessions\n- High openness (Alex) flexible and creative in offers[/dim]\n")
+    ]
+    console.print(Group(*renderables))
     
     return result
 
 
 def scenario_3_marketplace(agents):
     """Scenario 3: Multi-agent marketplace with price discovery"""
-    console.print("\n[bold yellow]═══ SCENARIO 3: Marketplace Dynamics ═══[/bold yellow]\n")
-    
-    console.print("Multiple buyers and sellers trade in an open marketplace.\n")
-    
     # Split into buyers and sellers
     buyers = agents[:2]   # Alex, Barbara
     sellers = agents[2:]  # Charlie, Diana
     
-    console.print(f"[bold]Buyers:[/bold] {', '.join(b.name for b in buyers)}")
-    console.print(f"[bold]Sellers:[/bold] {', '.join(s.name for s in sellers)}\n")
-    
-    console.print("[bold]Product:[/bold] Premium Feature Access")
-    console.print("[bold]Base Value:[/bold] 600 credits\n")
-    
-    console.print("[bold green]Market opening...[/bold green]\n")
+    console.print(Group(
+        markup("\n[bold yellow]═══ SCENARIO 3: Marketplace Dynamics ═══[/bold yellow]\n"),
+        markup("Multiple buyers and sellers trade in an open marketplace.\n"),
+        f"[bold]Buyers:[/bold] {', '.join(map(_name, buyers))}",
+        f"[bold]Sellers:[/bold] {', '.join(map(_name, sellers))}\n",
+        markup("[bold]Product:[/bold] Premium Feature Access"),
+        markup("[bold]Base Value:[/bold] 600 credits\n"),
+        markup("[bold green]Market opening...[/bold green]\n")
+    ))
     
     # Run market simulation
-    with console.status("[bold green]Agents trading...[/bold green]"):
+    with status("[bold green]Agents trading...[/bold green]"):
         result = simulate_market(
             buyers=buyers,
             sellers=sellers,
@@ -298,58 +298,62 @@ def scenario_3_marketplace(agents):
         )
     
     # Display transactions
+    renderables = []
     if result.transactions:
         trans_table = Table(title="Completed Transactions", box=box.ROUNDED)
         trans_table.add_column("Buyer", style="green")
         trans_table.add_column("Seller", style="red")
         trans_table.add_column("Price", style="yellow")
         
-        for trans in result.transactions:
-            trans_table.add_row(
-                trans.buyer_id,
-                trans.seller_id,
-                f"{trans.price:.0f} credits"
-            )
-        
-        console.print(trans_table)
+        price_cells = np.char.mod(
+            "%.0f credits",
+            np.fromiter((trans.price for trans in result.transactions), dtype=float)
+        )
+        for trans, price in zip(result.transactions, price_cells):
+            trans_table.add_row(trans.buyer_id, trans.seller_id, price)
         
         # Market statistics
-        console.print(f"\n[bold]Market Statistics:[/bold]")
-        console.print(f"  Average Price: {result.avg_price:.0f} credits")
-        console.print(f"  Price Range: {result.price_range[0]:.0f} - {result.price_range[1]:.0f} credits")
-        console.print(f"  Volume: {result.total_volume} units")
-        console.print(f"  Active Buyers: {result.active_buyers}/{len(buyers)}")
-        console.print(f"  Active Sellers: {result.active_sellers}/{len(sellers)}")
+        renderables += [
+            trans_table,
+            f"\n[bold]Market Statistics:[/bold]",
+            f"  Average Price: {result.avg_price:.0f} credits",
+            f"  Price Range: {result.price_range[0]:.0f} - {result.price_range[1]:.0f} credits",
+            f"  Volume: {result.total_volume} units",
+            f"  Active Buyers: {result.active_buyers}/{len(buyers)}",
+            f"  Active Sellers: {result.active_sellers}/{len(sellers)}"
+        ]
     else:
-        console.print("[bold red]No transactions occurred![/bold red]")
-        console.print("[dim]Buyers and sellers couldn't agree on price.[/dim]")
+        renderables += [
+            markup("[bold red]No transactions occurred![/bold red]"),
+            markup("[dim]Buyers and sellers couldn't agree on price.[/dim]")
+        ]
     
     # Show unsold and unmatched
     if result.unsold_listings:
-        console.print(f"\n[bold yellow]Unsold Listings:[/bold yellow] {len(result.unsold_listings)}")
-        for listing in result.unsold_listings:
-            console.print(f"  • {listing.seller_id}: {listing.price:.0f} credits (too high)")
+        renderables.append(f"\n[bold yellow]Unsold Listings:[/bold yellow] {len(result.unsold_listings)}")
+        renderables += [
+            f"  • {listing.seller_id}: {listing.price:.0f} credits (too high)"
+            for listing in result.unsold_listings
+        ]
     
     if result.unmatched_buyers:
-        console.print(f"\n[bold yellow]Unmatched Buyers:[/bold yellow] {', '.join(result.unmatched_buyers)}")
-        console.print("[dim]Either couldn't afford or didn't see sufficient value[/dim]")
-    
-    console.print("\n[bold]Insight:[/bold] Market price emerges from distributed decisions!")
-    console.print("[dim]- No central coordinator setting prices\n- Personality diversity creates price variation\n- Supply and demand find equilibrium naturally[/dim]\n")
+        renderables += [
+            f"\n[bold yellow]Unmatched Buyers:[/bold yellow] {', '.join(result.unmatched_buyers)}",
+            markup("[dim]Either couldn't afford or didn't see sufficient value[/dim]")
+        ]
+    
+    renderables += [
+        markup("\n[bold]Insight:[/bold] Market price emerges from distributed decisions!"),
+        markup("[dim]- No central coordinator setting prices\n- Personality diversity creates price variation\n- Supply and demand find equilibrium naturally[/dim]\n")
+    ]
+    console.print(Group(*renderables))
 
 
 def scenario_4_demand_curve(agents):
     """Scenario 4: Price sensitivity analysis"""
-    console.print("\n[bold yellow]═══ SCENARIO 4: Demand Curve Analysis ═══[/bold yellow]\n")
-    
-    console.print("How many units would sell at different prices?\n")
-    
     buyers = agents  # All agents as potential buyers
     item = "Cloud Computing Credits"
     
-    console.print(f"[bold]Analyzing:[/bold] {item}")
-    console.print(f"[bold]Buyers:[/bold] {len(buyers)} agents\n")
-    
     # Analyze demand at different prices
     demand = analyze_price_sensitivity(
         buyers=buyers,
@@ -365,39 +369,45 @@ def scenario_4_demand_curve(agents):
     demand_table.add_column("Quantity Demanded", style="green")
     demand_table.add_column("Visual", style="cyan")
     
-    max_qty = max(demand.values()) if demand else 1
-    
-    for price in sorted(demand.keys()):
-        qty = demand[price]
-        bar = "█" * int((qty / max_qty) * 20) if max_qty > 0 else ""
-        
-        demand_table.add_row(
-            f"{price:.0f} credits",
-            str(qty),
-            bar
-        )
-    
-    console.print(demand_table)
+    prices = np.fromiter(demand.keys(), dtype=np.float64, count=len(demand))
+    quantities = np.fromiter(demand.values(), dtype=np.int64, count=len(demand))
+    order = prices.argsort(kind="stable")
+    prices, quantities = prices[order], quantities[order]
+    max_qty = quantities.max() if len(quantities) else 1
     
-    # Find optimal price (maximize revenue)
-    revenues = {price: price * qty for price, qty in demand.items()}
-    optimal_price = max(revenues, key=revenues.get)
-    optimal_revenue = revenues[optimal_price]
-    optimal_qty = demand[optimal_price]
-    
-    console.print(f"\n[bold]Revenue Maximization:[/bold]")
-    console.print(f"  Optimal Price: {optimal_price:.0f} credits")
-    console.print(f"  Quantity: {optimal_qty} units")
-    console.print(f"  Total Revenue: {optimal_revenue:.0f} credits")
-    
-    console.print("\n[bold]Insight:[/bold] Demand curves emerge from agent psychology!")
-    console.print("[dim]- Lower prices → more buyers (affordability)\n- Higher prices → fewer buyers (insufficient value)\n- Sweet spot balances volume and margin[/dim]\n")
+    if max_qty > 0:
+        bar_lengths = ((quantities / max_qty) * DEMAND_BAR_WIDTH).astype(int)
+    else:
+        bar_lengths = np.zeros_like(quantities)
+    
+    price_cells = np.char.mod("%.0f credits", prices)
+    qty_cells = quantities.astype(str)
+    
+    for price, qty, length in zip(price_cells, qty_cells, bar_lengths):
+        demand_table.add_row(price, qty, DEMAND_BAR[:length])
+    
+    # Find optimal price (maximize revenue; cheapest price wins ties)
+    revenues = prices * quantities
+    best = revenues.argmax()
+    optimal_price, optimal_qty, optimal_revenue = prices[best], quantities[best], revenues[best]
+    
+    console.print(Group(
+        markup("\n[bold yellow]═══ SCENARIO 4: Demand Curve Analysis ═══[/bold yellow]\n"),
+        markup("How many units would sell at different prices?\n"),
+        f"[bold]Analyzing:[/bold] {item}",
+        f"[bold]Buyers:[/bold] {len(buyers)} agents\n",
+        demand_table,
+        f"\n[bold]Revenue Maximization:[/bold]",
+        f"  Optimal Price: {optimal_price:.0f} credits",
+        f"  Quantity: {optimal_qty} units",
+        f"  Total Revenue: {optimal_revenue:.0f} credits",
+        markup("\n[bold]Insight:[/bold] Demand curves emerge from agent psychology!"),
+        markup("[dim]- Lower prices → more buyers (affordability)\n- Higher prices → fewer buyers (insufficient value)\n- Sweet spot balances volume and margin[/dim]\n")
+    ))
 
 
 def display_key_insights():
     """Display key insights from agent economy"""
-    console.print("\n[bold yellow]═══ KEY INSIGHTS ═══[/bold yellow]\n")
-    
     insights = [
         "[bold green]✓[/bold green] [bold]Differential Valuation:[/bold] Same product, different values based on personality",
         "[bold green]✓[/bold green] [bold]Negotiation Dynamics:[/bold] Personality traits shape bargaining strategies",
@@ -406,11 +416,12 @@ def display_key_insights():
         "[bold yellow]→[/bold yellow] [bold]Real-World Applications:[/bold] Pricing optimization, negotiation training, market simulation"
     ]
     
-    for insight in insights:
-        console.print(f"  {insight}")
-    
-    console.print("\n[dim]Traditional personas are static preferences.\n"
-                 "Economic agents make real tradeoffs under constraints.[/dim]\n")
+    console.print(markup(
+        "\n[bold yellow]═══ KEY INSIGHTS ═══[/bold yellow]\n\n"
+        + "\n".join(f"  {insight}" for insight in insights)
+        + "\n\n[dim]Traditional personas are static preferences.\n"
+        "Economic agents make real tradeoffs under constraints.[/dim]\n"
+    ))
 
 
 def main():
@@ -428,8 +439,10 @@ def main():
     # Show insights
     display_key_insights()
     
-    console.print("\n[bold cyan]Next: Article 4 - Algorithmic Evolution[/bold cyan]")
-    console.print("[dim]Where agent behaviors drift and adapt over time.[/dim]\n")
+    console.print(Group(
+        markup("\n[bold cyan]Next: Article 4 - Algorithmic Evolution[/bold cyan]"),
+        markup("[dim]Where agent behaviors drift and adapt over time.[/dim]\n")
+    ))
 
 
 if __name__ == "__main__":
@@ -11,17 +11,14 @@ This example demonstrates how Synthetic Citizens evolve over time through:
 Accompanying Article: "Algorithmic Evolution: When Agents Drift"
 """
 
-import sys
-import os
+from datetime import datetime
+
+import numpy as np
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 from rich.progress import track
-import time
-
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
 
 from simulacrum.agents.persona import (
     PsychologicalProfile,
@@ -35,6 +32,7 @@ from simulacrum.evolution.temporal import (
     LongTermSimulation
 )
 from simulacrum.evolution.learning import (
+    AdaptiveLearner,
     create_adaptive_learner,
     OutcomeType,
     PopulationLearning
@@ -117,7 +115,6 @@ def scenario_1_experience_shapes_personality(agents):
                 "neuroticism": -0.02   # Less anxious
             }
         )
-        time.sleep(0.1)  # Brief pause for effect
     
     # Barbara has mixed experiences (careful approach vindicated)
     console.print("\n[bold yellow]Barbara (Skeptic)[/bold yellow] - Cautious approach prevents disasters")
@@ -132,7 +129,6 @@ def scenario_1_experience_shapes_personality(agents):
                 "openness": -0.01           # Less open to risk
             }
         )
-        time.sleep(0.1)
     
     # Charlie has negative experiences (failures increase anxiety)
     console.print("\n[bold red]Charlie (Anxious User)[/bold red] - Series of setbacks")
@@ -147,7 +143,6 @@ def scenario_1_experience_shapes_personality(agents):
                 "openness": -0.02      # More conservative
             }
         )
-        time.sleep(0.1)
     
     # Show trait changes
     console.print("\n[bold]Trait Changes After 90 Days:[/bold]\n")
@@ -204,7 +199,6 @@ def scenario_2_social_influence(agents):
         
         # Advance time
         sim.advance_time(days=2)
-        time.sleep(0.05)
     
     # Analyze convergence
     analysis = sim.analyze_evolution()
@@ -256,39 +250,46 @@ def scenario_3_learning_from_outcomes(agents):
     # Simulate 20 pricing decisions
     console.print("[bold green]Simulating 20 pricing decisions...[/bold green]\n")
     
-    import random
     strategies = [
         ("aggressive", 0.4),   # 40% success rate
         ("moderate", 0.7),     # 70% success rate
         ("conservative", 0.5)  # 50% success rate
     ]
     
-    for round_num in track(range(20), description="Decisions"):
-        for learner in learners:
+    # Draw every random strategy pick and outcome coin up front
+    rounds = 20
+    rng = np.random.default_rng()
+    random_picks = rng.integers(0, len(strategies), size=(rounds, len(learners))).tolist()
+    coins = rng.random(size=(rounds, len(learners))).tolist()
+    
+    for round_num in track(range(rounds), description="Decisions"):
+        now = datetime.now()  # One clock reading per round
+        explore = AdaptiveLearner.should_explore_batch(learners, rng)
+        for i, learner in enumerate(learners):
             # Decide: explore or exploit?
-            if learner.should_explore() or round_num < 5:
+            if explore[i] or round_num < 5:
                 # Try random strategy
-                strategy, success_prob = random.choice(strategies)
+                strategy, success_prob = strategies[random_picks[round_num][i]]
             else:
                 # Use best known strategy
                 best = learner.get_best_strategy("pricing")
                 if best:
-                    # Extract strategy from description
-                    strategy = best.description.split("'")[1]
+                    strategy = best.choice
                     success_prob = best.success_rate
                 else:
-                    strategy, success_prob = random.choice(strategies)
+                    strategy, success_prob = strategies[random_picks[round_num][i]]
             
             # Record decision
             decision = learner.record_decision(
                 context="pricing",
                 choice=strategy,
                 reasoning=f"Round {round_num+1} pricing strategy",
-                confidence=success_prob
+                confidence=success_prob,
+                timestamp=now
             )
             
             # Simulate outcome
-            success = random.random() < success_prob
+            success = coins[round_num][i] < success_prob
             reward = 100 if success else -50
             
             outcome_type = OutcomeType.SUCCESS if success else OutcomeType.FAILURE
@@ -296,10 +297,9 @@ def scenario_3_learning_from_outcomes(agents):
                 decision.id,
                 outcome_type,
                 reward=reward,
-                feedback=f"Strategy {'worked' if success else 'failed'}"
+                feedback=f"Strategy {'worked' if success else 'failed'}",
+                timestamp=now
             )
-        
-        time.sleep(0.05)
     
     # Show learning results
     console.print("\n[bold]Learning Outcomes:[/bold]\n")
@@ -319,7 +319,7 @@ def scenario_3_learning_from_outcomes(agents):
             agents[i].agent.name,
             str(perf["total_decisions"]),
             f"{perf['success_rate']:.1%}",
-            best_strat.get("description", "N/A").split("'")[1] if "'" in best_strat.get("description", "") else "N/A",
+            best_strat.get("choice") or "N/A",
             f"{best_strat.get('success_rate', 0):.1%}" if best_strat else "N/A"
         )
     
@@ -347,12 +347,14 @@ def scenario_4_population_knowledge_sharing(agents):
     console.print("[bold green]Alex[/bold green] discovers effective strategies early...\n")
     
     # Alex learns "moderate" strategy works well
+    now = datetime.now()
     for i in range(10):
-        decision = learners[0].record_decision("pricing", "moderate")
+        decision = learners[0].record_decision("pricing", "moderate", timestamp=now)
         learners[0].record_outcome(
             decision.id,
             OutcomeType.SUCCESS,
-            reward=100
+            reward=100,
+            timestamp=now
         )
     
     # Create population learning system
@@ -364,7 +366,6 @@ def scenario_4_population_knowledge_sharing(agents):
     for generation in track(range(10), description="Generations"):
         pop_learning.share_knowledge(interaction_probability=0.4)
         pop_learning.generation += 1
-        time.sleep(0.1)
     
     # Analyze population
     stats = pop_learning.get_population_statistics()
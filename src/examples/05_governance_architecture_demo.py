@@ -11,8 +11,6 @@ This example demonstrates how to govern evolving AI agents through:
 Accompanying Article: "Governance as Architecture"
 """
 
-import sys
-import os
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -20,9 +18,6 @@ from rich import box
 from rich.progress import track
 import time
 
-# Add the src directory to the path
-sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
-
 from simulacrum.agents.persona import (
     create_early_adopter,
     create_skeptic,
@@ -1,10 +1,20 @@
 # src/simulacrum/agents/persona.py
 
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime
+from functools import lru_cache
+from collections import OrderedDict
+from operator import attrgetter
+from types import MappingProxyType
+import threading
+import numpy as np
 from simulacrum.core.llm import LLMEngine
 
+# Column order used whenever traits are handled as vectors
+TRAIT_NAMES = ("openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism")
+_trait_values = attrgetter(*TRAIT_NAMES)
+
 class PsychologicalProfile(BaseModel):
     """
     Big Five personality traits (OCEAN model)
@@ -16,40 +26,64 @@ class PsychologicalProfile(BaseModel):
     agreeableness: float = Field(0.5, ge=0, le=1, description="Cooperation, empathy, trust")
     neuroticism: float = Field(..., ge=0, le=1, description="Emotional instability, anxiety, stress response")
     
+    @classmethod
+    def from_vector(cls, values) -> "PsychologicalProfile":
+        """Build a profile from a length-5 sequence ordered as TRAIT_NAMES"""
+        return cls(**{trait: float(value) for trait, value in zip(TRAIT_NAMES, values)})
+    
+    def __array__(self, dtype=None, copy=None):
+        """Expose the traits as a length-5 vector ordered as TRAIT_NAMES"""
+        return np.array(_trait_values(self), dtype=dtype or np.float64)
+    
     def get_trait_interpretation(self, trait_name: str) -> str:
         """Provide human-readable interpretation of trait levels"""
-        value = getattr(self, trait_name.lower())
-        
-        interpretations = {
-            "openness": {
-                "high": "creative, curious, open to new experiences",
-                "medium": "moderately open to new ideas",
-                "low": "traditional, prefers routine, resistant to change"
-            },
-            "conscientiousness": {
-                "high": "organized, disciplined, detail-oriented",
-                "medium": "moderately organized",
-                "low": "spontaneous, flexible, less concerned with planning"
-            },
-            "extraversion": {
-                "high": "outgoing, energetic, seeks social interaction",
-                "medium": "balanced between social and solitary activities",
-                "low": "reserved, introspective, prefers solitude"
-            },
-            "agreeableness": {
-                "high": "cooperative, empathetic, trusting",
-                "medium": "moderately cooperative",
-                "low": "competitive, skeptical, direct"
-            },
-            "neuroticism": {
-                "high": "anxious, emotionally reactive, stress-prone",
-                "medium": "moderately emotionally stable",
-                "low": "calm, emotionally stable, resilient"
-            }
-        }
-        
-        level = "high" if value > 0.65 else "low" if value < 0.35 else "medium"
-        return interpretations.get(trait_name.lower(), {}).get(level, "undefined")
+        return _interpret_trait(trait_name, getattr(self, trait_name.lower()))
+
+def trait_matrix(agents: List[Any]) -> np.ndarray:
+    """
+    Stack agents' Big Five traits into an (n_agents, 5) float array.
+    
+    Columns follow TRAIT_NAMES, so population-level trait math (tallies,
+    averages, spreads) can run as single NumPy operations.
+    """
+    return np.array(
+        [_trait_values(agent.traits) for agent in agents],
+        dtype=np.float64
+    ).reshape(len(agents), len(TRAIT_NAMES))
+
+# Trait -> level -> description, shared by every prompt build
+_TRAIT_INTERPRETATIONS = MappingProxyType({
+    "openness": {
+        "high": "creative, curious, open to new experiences",
+        "medium": "moderately open to new ideas",
+        "low": "traditional, prefers routine, resistant to change"
+    },
+    "conscientiousness": {
+        "high": "organized, disciplined, detail-oriented",
+        "medium": "moderately organized",
+        "low": "spontaneous, flexible, less concerned with planning"
+    },
+    "extraversion": {
+        "high": "outgoing, energetic, seeks social interaction",
+        "medium": "balanced between social and solitary activities",
+        "low": "reserved, introspective, prefers solitude"
+    },
+    "agreeableness": {
+        "high": "cooperative, empathetic, trusting",
+        "medium": "moderately cooperative",
+        "low": "competitive, skeptical, direct"
+    },
+    "neuroticism": {
+        "high": "anxious, emotionally reactive, stress-prone",
+        "medium": "moderately emotionally stable",
+        "low": "calm, emotionally stable, resilient"
+    }
+})
+
+def _interpret_trait(trait_name: str, value: float) -> str:
+    """Map a trait value to its high/medium/low description"""
+    level = "high" if value > 0.65 else "low" if value < 0.35 else "medium"
+    return _TRAIT_INTERPRETATIONS.get(trait_name.lower(), {}).get(level, "undefined")
 
 class MemoryEntry(BaseModel):
     """Single memory record with metadata"""
@@ -66,6 +100,109 @@ class DemographicProfile(BaseModel):
     income_bracket: Optional[str] = None
     geographic_region: Optional[str] = None
 
+_PROFILE_TEMPLATE = (
+    "You are {name}, a {role}.\n"
+    "\n"
+    "PERSONALITY PROFILE (0.0-1.0 scale):\n"
+    "- Openness: {openness} ({openness_desc})\n"
+    "- Conscientiousness: {conscientiousness} ({conscientiousness_desc})\n"
+    "- Extraversion: {extraversion} ({extraversion_desc})\n"
+    "- Agreeableness: {agreeableness} ({agreeableness_desc})\n"
+    "- Neuroticism: {neuroticism} ({neuroticism_desc})"
+)
+
+_BEHAVIORAL_GUIDELINES = (
+    "\n"
+    "\n"
+    "BEHAVIORAL GUIDELINES:\n"
+    "1. Your response must reflect your personality traits consistently\n"
+    "2. React authentically as this person would—not as a neutral AI\n"
+    "3. Use first-person perspective ('I think...' not 'As [name]...')\n"
+    "4. Keep responses concise and natural (1-3 sentences)\n"
+    "5. Show emotional reactions aligned with your neuroticism level"
+)
+
+_VERBOSE_GUIDELINE = "\n6. Begin with [THINKING: ...] to show your reasoning process"
+
+@lru_cache(maxsize=256)
+def _render_system_prompt(
+    name: str,
+    role: str,
+    traits: Tuple[float, float, float, float, float],
+    backstory: Optional[str],
+    core_values: Tuple[str, ...],
+    age: Optional[int],
+    occupation: Optional[str],
+    verbose_thinking: bool
+) -> str:
+    """
+    Assemble a persona system prompt from hashable persona fields.
+    
+    Memoized so citizens with the same persona share one prompt string, and a
+    persona's prompt stays byte-identical across rounds (a stable prefix for
+    provider-side prompt caching). Trait drift changes the key, so mutated
+    citizens never see a stale prompt.
+    """
+    fields = {"name": name, "role": role}
+    for trait_name, value in zip(TRAIT_NAMES, traits):
+        fields[trait_name] = value
+        fields[trait_name + "_desc"] = _interpret_trait(trait_name, value)
+    
+    prompt = _PROFILE_TEMPLATE.format_map(fields)
+    
+    if backstory:
+        prompt += f"\n\nBACKSTORY: {backstory}"
+    
+    if core_values:
+        prompt += f"\n\nCORE VALUES: {', '.join(core_values)}"
+    
+    demo_parts = []
+    if age:
+        demo_parts.append(f"Age: {age}")
+    if occupation:
+        demo_parts.append(f"Occupation: {occupation}")
+    if demo_parts:
+        prompt += "\n\nDEMOGRAPHICS:\n- " + "\n- ".join(demo_parts)
+    
+    prompt += _BEHAVIORAL_GUIDELINES
+    if verbose_thinking:
+        prompt += _VERBOSE_GUIDELINE
+    
+    return prompt
+
+# Responses shared between citizens that opt in via share_responses, keyed on
+# (model, temperature, persona fields minus name, user prompt); LRU eviction
+RESPONSE_CACHE_SIZE = 512
+_response_cache: "OrderedDict[Tuple, str]" = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+def _cached_response(key: Optional[Tuple]) -> Optional[str]:
+    """Look up a shared response, marking it as recently used"""
+    if key is None:
+        return None
+    
+    with _response_cache_lock:
+        response = _response_cache.get(key)
+        if response is not None:
+            _response_cache.move_to_end(key)
+        return response
+
+def _cache_response(key: Optional[Tuple], response: str) -> None:
+    """Store a shared response, evicting the least recently used beyond the limit"""
+    if key is None:
+        return
+    
+    with _response_cache_lock:
+        _response_cache[key] = response
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > RESPONSE_CACHE_SIZE:
+            _response_cache.popitem(last=False)
+
+@lru_cache(maxsize=8)
+def _get_engine(model_name: str) -> LLMEngine:
+    """One shared engine per model"""
+    return LLMEngine(model_name=model_name)
+
 class Citizen(BaseModel):
     """
     A Synthetic Citizen: An AI agent with psychological consistency,
@@ -78,8 +215,9 @@ class Citizen(BaseModel):
     backstory: Optional[str] = None
     
     # Memory systems
-    memory: List[MemoryEntry] = []
-    core_values: List[str] = []  # e.g., ["security", "innovation", "family"]
+    memory: List[MemoryEntry] = Field(default_factory=list)
+    memory_limit: Optional[int] = None  # Keep only the most recent N memories (None = unbounded)
+    core_values: List[str] = Field(default_factory=list)  # e.g., ["security", "innovation", "family"]
     
     # LLM configuration
     model: str = "openai/gpt-3.5-turbo"
@@ -87,6 +225,7 @@ class Citizen(BaseModel):
     
     # Behavioral flags
     verbose_thinking: bool = False  # If True, returns chain of thought
+    share_responses: bool = False  # If True, reuse answers of identical personas (name aside)
     
     class Config:
         arbitrary_types_allowed = True
@@ -102,49 +241,50 @@ class Citizen(BaseModel):
         
         return "\n".join(traits_desc)
     
+    def _persona_fields(self) -> Tuple:
+        """Hashable snapshot of everything that shapes the persona, except the name"""
+        traits = self.traits
+        demographics = self.demographics
+        
+        return (
+            self.role,
+            (traits.openness, traits.conscientiousness, traits.extraversion,
+             traits.agreeableness, traits.neuroticism),
+            self.backstory,
+            tuple(self.core_values),
+            demographics.age if demographics else None,
+            demographics.occupation if demographics else None,
+            self.verbose_thinking
+        )
+    
     def _build_system_prompt(self) -> str:
         """Construct the system prompt that defines the agent's identity"""
-        prompt_parts = [
-            f"You are {self.name}, a {self.role}.",
-            "",
-            "PERSONALITY PROFILE (0.0-1.0 scale):",
-            f"- Openness: {self.traits.openness} ({self.traits.get_trait_interpretation('openness')})",
-            f"- Conscientiousness: {self.traits.conscientiousness} ({self.traits.get_trait_interpretation('conscientiousness')})",
-            f"- Extraversion: {self.traits.extraversion} ({self.traits.get_trait_interpretation('extraversion')})",
-            f"- Agreeableness: {self.traits.agreeableness} ({self.traits.get_trait_interpretation('agreeableness')})",
-            f"- Neuroticism: {self.traits.neuroticism} ({self.traits.get_trait_interpretation('neuroticism')})",
-        ]
-        
-        if self.backstory:
-            prompt_parts.extend(["", f"BACKSTORY: {self.backstory}"])
-        
-        if self.core_values:
-            values_str = ", ".join(self.core_values)
-            prompt_parts.extend(["", f"CORE VALUES: {values_str}"])
-        
-        if self.demographics:
-            demo_parts = []
-            if self.demographics.age:
-                demo_parts.append(f"Age: {self.demographics.age}")
-            if self.demographics.occupation:
-                demo_parts.append(f"Occupation: {self.demographics.occupation}")
-            if demo_parts:
-                prompt_parts.extend(["", "DEMOGRAPHICS:", "- " + "\n- ".join(demo_parts)])
+        return _render_system_prompt(self.name, *self._persona_fields())
+    
+    def _response_key(self, user_prompt: str) -> Optional[Tuple]:
+        """Shared-response cache key, or None if this citizen doesn't share"""
+        if not self.share_responses:
+            return None
+        return (self.model, self.temperature, self._persona_fields(), user_prompt)
+    
+    def _build_user_prompt(self, stimulus: str, context: Optional[str] = None) -> str:
+        """
+        Construct the user prompt from stimulus, optional context and recent memory.
         
-        prompt_parts.extend([
-            "",
-            "BEHAVIORAL GUIDELINES:",
-            "1. Your response must reflect your personality traits consistently",
-            "2. React authentically as this person would—not as a neutral AI",
-            "3. Use first-person perspective ('I think...' not 'As [name]...')",
-            "4. Keep responses concise and natural (1-3 sentences)",
-            "5. Show emotional reactions aligned with your neuroticism level",
-        ])
+        Only this per-call tail is built here; the persona prompt is cached.
+        """
+        # Include recent memory if available (last 3 interactions)
+        recent = [
+            f"- You encountered: '{mem.stimulus}' and responded: '{mem.response}'"
+            for mem in self.memory[-3:]
+        ]
         
-        if self.verbose_thinking:
-            prompt_parts.append("6. Begin with [THINKING: ...] to show your reasoning process")
+        parts = [f"CONTEXT: {context}\n"] if context else []
+        if recent:
+            parts += ["RECENT MEMORY:", *recent, ""]
+        parts += [f"CURRENT STIMULUS:\n{stimulus}", "\nHow do you react?"]
         
-        return "\n".join(prompt_parts)
+        return "\n".join(parts)
     
     def think(self, stimulus: str, context: Optional[str] = None) -> str:
         """
@@ -157,47 +297,116 @@ class Citizen(BaseModel):
         Returns:
             The citizen's authentic reaction
         """
-        engine = LLMEngine(model_name=self.model)
+        user_prompt = self._build_user_prompt(stimulus, context)
+        key = self._response_key(user_prompt)
         
-        system_prompt = self._build_system_prompt()
+        # Generate response, unless an identical persona already answered
+        response = _cached_response(key)
+        if response is None:
+            engine = _get_engine(self.model)
+            response = engine.generate(self._build_system_prompt(), user_prompt, temperature=self.temperature)
+            _cache_response(key, response)
         
-        # Build user prompt with optional context and memory
-        user_prompt_parts = []
+        # Store in memory
+        self._store_memory(stimulus, response)
         
-        if context:
-            user_prompt_parts.append(f"CONTEXT: {context}\n")
+        return response
+    
+    async def athink(self, stimulus: str, context: Optional[str] = None) -> str:
+        """
+        Async version of think().
         
-        # Include recent memory if available (last 3 interactions)
-        if self.memory:
-            recent_memories = self.memory[-3:]
-            user_prompt_parts.append("RECENT MEMORY:")
-            for mem in recent_memories:
-                user_prompt_parts.append(f"- You encountered: '{mem.stimulus}' and responded: '{mem.response}'")
-            user_prompt_parts.append("")
+        Use with asyncio.gather to let a whole panel react concurrently:
+            reactions = await asyncio.gather(*[c.athink(msg) for c in citizens])
+        """
+        user_prompt = self._build_user_prompt(stimulus, context)
+        key = self._response_key(user_prompt)
         
-        user_prompt_parts.append(f"CURRENT STIMULUS:\n{stimulus}")
-        user_prompt_parts.append("\nHow do you react?")
+        response = _cached_response(key)
+        if response is None:
+            engine = _get_engine(self.model)
+            response = await engine.agenerate(self._build_system_prompt(), user_prompt, temperature=self.temperature)
+            _cache_response(key, response)
         
-        user_prompt = "\n".join(user_prompt_parts)
+        self._store_memory(stimulus, response)
         
-        # Generate response
-        response = engine.generate(system_prompt, user_prompt, temperature=self.temperature)
+        return response
+    
+    @classmethod
+    def batch_think(cls, requests: List[Tuple["Citizen", str, Optional[str]]]) -> List[str]:
+        """
+        Run one round of thinking for many citizens through LLMEngine.generate_batch.
         
-        # Store in memory
-        memory_entry = MemoryEntry(
-            stimulus=stimulus,
-            response=response
-        )
-        self.memory.append(memory_entry)
+        Args:
+            requests: (citizen, stimulus, context) tuples, one per citizen
         
-        return response
+        Returns:
+            Responses in the same order as requests
+        
+        Citizens sharing a model and temperature go out in one generate_batch
+        round (one concurrent request per prompt); each still gets its own
+        persona prompt.
+        Citizens with share_responses reuse cached answers, and identical
+        ones asking the same thing are sent only once per batch.
+        """
+        responses: List[Optional[str]] = [None] * len(requests)
+        user_prompts: List[Optional[str]] = [None] * len(requests)
+        keys: List[Optional[Tuple]] = [None] * len(requests)
+        
+        groups: Dict[Tuple[str, float], List[int]] = {}
+        for i, (citizen, _, _) in enumerate(requests):
+            groups.setdefault((citizen.model, citizen.temperature), []).append(i)
+        
+        for (model, temperature), indices in groups.items():
+            to_send: List[int] = []
+            first_with_key: Dict[Tuple, int] = {}
+            duplicates: List[Tuple[int, int]] = []
+            
+            for i in indices:
+                citizen, stimulus, context = requests[i]
+                user_prompts[i] = citizen._build_user_prompt(stimulus, context)
+                keys[i] = citizen._response_key(user_prompts[i])
+                
+                cached = _cached_response(keys[i])
+                if cached is not None:
+                    responses[i] = cached
+                elif keys[i] in first_with_key:
+                    duplicates.append((i, first_with_key[keys[i]]))
+                else:
+                    if keys[i] is not None:
+                        first_with_key[keys[i]] = i
+                    to_send.append(i)
+            
+            if to_send:
+                engine = _get_engine(model)
+                results = engine.generate_batch(
+                    [requests[i][0]._build_system_prompt() for i in to_send],
+                    [user_prompts[i] for i in to_send],
+                    temperature=temperature
+                )
+                
+                for i, response in zip(to_send, results):
+                    responses[i] = response
+                    _cache_response(keys[i], response)
+            
+            for i, original in duplicates:
+                responses[i] = responses[original]
+        
+        for (citizen, stimulus, _), response in zip(requests, responses):
+            citizen._store_memory(stimulus, response)
+        
+        return responses
     
     def remember(self, event: str, context: str = "") -> None:
         """Store an event directly in memory without LLM processing."""
-        self.memory.append(MemoryEntry(
-            stimulus=event,
-            response=context or "noted"
-        ))
+        self._store_memory(event, context or "noted")
+    
+    def _store_memory(self, stimulus: str, response: str) -> None:
+        """Append a memory, dropping the oldest ones beyond memory_limit"""
+        self.memory.append(MemoryEntry(stimulus=stimulus, response=response))
+        
+        if self.memory_limit is not None and len(self.memory) > self.memory_limit:
+            del self.memory[:len(self.memory) - self.memory_limit]
 
     def recall(self, keyword: str) -> List[MemoryEntry]:
         """Retrieve memories containing a specific keyword"""
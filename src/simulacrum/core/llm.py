@@ -1,14 +1,66 @@
 # src/simulacrum/core/llm.py
 
 import os
-from typing import List, Dict, Any, Optional
-import litellm
-from tenacity import retry, stop_after_attempt, wait_exponential
+import asyncio
+from typing import List, Dict, Any, Optional, Tuple
+from tenacity import (
+    Retrying,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_random,
+)
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Safety settings for Gemini to prevent blocking valid simulation scenarios
+GEMINI_SAFETY_SETTINGS = [
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+]
+
+_litellm = None
+
+def get_litellm():
+    """
+    Import litellm on first use.
+    
+    litellm takes seconds to import, so deferring it keeps startup instant for
+    code paths that never call a model (tests, utility-only simulations).
+    litellm's global settings are left alone: it already keeps its provider
+    clients (and their keep-alive connections) cached per event loop.
+    """
+    global _litellm
+    if _litellm is None:
+        import litellm
+        _litellm = litellm
+    return _litellm
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    True for provider errors worth retrying: rate limits, dropped
+    connections and timeouts. Bad auth or malformed requests fail fast.
+    """
+    litellm = get_litellm()
+    return isinstance(
+        exc,
+        (litellm.RateLimitError, litellm.APIConnectionError, litellm.Timeout)
+    )
+
+# Short jittered backoff (~0.5s, 1s, 2s) so a transient 429 costs a second or
+# two instead of a 4s floor, and concurrent agents don't retry in lockstep.
+_RETRY_POLICY = dict(
+    retry=retry_if_exception(_is_transient_error),
+    stop=stop_after_attempt(4),
+    wait=wait_exponential(multiplier=0.5, min=0.5, max=8) + wait_random(0, 0.5)
+)
+_retry_transient = retry(**_RETRY_POLICY)
+
 class LLMEngine:
     def __init__(self, model_name: str = "openai/gpt-3.5-turbo"):
         """
@@ -21,8 +73,9 @@ class LLMEngine:
                            - "ollama/llama3" (Local/Privacy)
         """
         self.model_name = model_name
+        self.safety_settings = GEMINI_SAFETY_SETTINGS if "gemini" in model_name else None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+    @_retry_transient
     def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
         """
         A robust wrapper around litellm.completion with retries.
@@ -33,17 +86,11 @@ class LLMEngine:
                 {"role": "user", "content": user_prompt}
             ]
 
-            response = litellm.completion(
+            response = get_litellm().completion(
                 model=self.model_name,
                 messages=messages,
                 temperature=temperature,
-                # Safety settings for Gemini to prevent blocking valid simulation scenarios
-                safety_settings=[
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                ] if "gemini" in self.model_name else None
+                safety_settings=self.safety_settings
             )
 
             return response.choices[0].message.content.strip()
@@ -52,3 +99,100 @@ class LLMEngine:
             # As an Architect, we want detailed logs when the 'Brain' fails
             print(f"Error generating response from {self.model_name}: {e}")
             raise e
+
+    @_retry_transient
+    async def agenerate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7) -> str:
+        """
+        Async counterpart of generate() built on litellm.acompletion.
+
+        Lets callers fan out many agents concurrently with asyncio.gather.
+        """
+        try:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+
+            response = await get_litellm().acompletion(
+                model=self.model_name,
+                messages=messages,
+                temperature=temperature,
+                safety_settings=self.safety_settings
+            )
+
+            return response.choices[0].message.content.strip()
+
+        except Exception as e:
+            print(f"Error generating response from {self.model_name}: {e}")
+            raise e
+
+    async def agenerate_many(
+        self,
+        prompts: List[Tuple[str, str]],
+        temperature: float = 0.7
+    ) -> List[str]:
+        """
+        Run agenerate() for every (system, user) pair concurrently.
+
+        A round then takes about as long as its slowest call; responses are
+        returned in input order, and each call keeps its own retries.
+        """
+        return await asyncio.gather(*[
+            self.agenerate(system_prompt, user_prompt, temperature=temperature)
+            for system_prompt, user_prompt in prompts
+        ])
+
+    def generate_batch(
+        self,
+        system_prompts: List[str],
+        user_prompts: List[str],
+        temperature: float = 0.7
+    ) -> List[str]:
+        """
+        Run a whole round of prompts through litellm.batch_completion.
+
+        batch_completion still sends one request per prompt (from a thread
+        pool); it just saves the caller the fan-out. Each (system, user) pair
+        stays a separate conversation, and responses are returned in input
+        order. Only prompts that failed with a transient error are re-sent on
+        retry, so answers already received are never requested (or billed)
+        twice.
+        """
+        batch_messages = [
+            [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            for system_prompt, user_prompt in zip(system_prompts, user_prompts)
+        ]
+        results: List[Optional[str]] = [None] * len(batch_messages)
+        pending = list(range(len(batch_messages)))
+
+        try:
+            for attempt in Retrying(**_RETRY_POLICY):
+                with attempt:
+                    responses = get_litellm().batch_completion(
+                        model=self.model_name,
+                        messages=[batch_messages[i] for i in pending],
+                        temperature=temperature,
+                        safety_settings=self.safety_settings
+                    )
+
+                    # batch_completion returns failures inline instead of raising
+                    failed = []
+                    for i, response in zip(pending, responses):
+                        if isinstance(response, Exception):
+                            failed.append(response)
+                        else:
+                            results[i] = response.choices[0].message.content.strip()
+                    pending = [i for i in pending if results[i] is None]
+
+                    if failed:
+                        # A permanent error fails the batch instead of being retried
+                        raise next((e for e in failed if not _is_transient_error(e)), failed[0])
+
+            return results
+
+        except Exception as e:
+            print(f"Error generating batch responses from {self.model_name}: {e}")
+            raise e
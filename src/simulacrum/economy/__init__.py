@@ -12,6 +12,7 @@ from simulacrum.economy.wallet import (
     UtilityFunction,
     create_economic_citizen,
     calculate_utility,
+    calculate_utility_batch,
     willing_to_buy,
     make_purchase,
     evaluate_price
@@ -42,6 +43,7 @@ __all__ = [
     "UtilityFunction",
     "create_economic_citizen",
     "calculate_utility",
+    "calculate_utility_batch",
     "willing_to_buy",
     "make_purchase",
     "evaluate_price",
@@ -9,6 +9,9 @@ from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 from collections import defaultdict
 import statistics
+import numpy as np
+from simulacrum.agents.persona import TRAIT_NAMES, trait_matrix
+from simulacrum.economy.wallet import calculate_utility_batch
 
 
 class Listing(BaseModel):
@@ -100,7 +103,7 @@ class Marketplace:
         buyers: List[Any],
         sellers: List[Any],
         item: str,
-        context: Dict[str, Any] = {}
+        context: Optional[Dict[str, Any]] = None
     ) -> MarketResult:
         """
         Simulate a trading session with multiple agents.
@@ -111,16 +114,14 @@ class Marketplace:
         3. Market clears
         4. Return results
         """
+        context = context or {}
         self.listings = []
         self.transactions = []
         
-        # Phase 1: Sellers create listings
-        for seller in sellers:
-            # Seller decides on asking price
-            asking_price = self._seller_price_decision(
-                seller, item, context
-            )
-            
+        # Phase 1: Sellers create listings, all asking prices decided at once
+        asking_prices = self._seller_prices(sellers, item, context)
+        
+        for seller, asking_price in zip(sellers, asking_prices.tolist()):
             self.add_listing(
                 seller=seller,
                 item=item,
@@ -129,99 +130,107 @@ class Marketplace:
                 description=context.get("description", "")
             )
         
-        # Phase 2: Buyers make purchases
+        # Phase 2: Buyers make purchases, in turn, from what is left
         active_buyers = []
         
-        for buyer in buyers:
-            # Get listings within budget
-            affordable = self.get_listings(
-                item=item,
-                max_price=buyer.wallet.balance
-            )
-            
-            if not affordable:
-                continue  # Can't afford anything
-            
-            # Buyer evaluates listings
-            best_listing = self._buyer_purchase_decision(
-                buyer, affordable, item, context
-            )
+        prices = np.array([listing.price for listing in self.listings])
+        available = np.ones(len(self.listings), dtype=bool)
+        cheapest_first = np.argsort(prices, kind="stable")
+        
+        shared_base_value = "base_value" in context
+        if shared_base_value:
+            # Every listing is worth the same to a buyer, so the best surplus
+            # is always the cheapest listing left: clear with one cursor
+            uniform_values = calculate_utility_batch(buyers, item, context["base_value"], context).tolist()
+            price_list = prices.tolist()
+            queue = cheapest_first.tolist()
+            cursor = 0
+        else:
+            values = self._valuation_matrix(buyers, prices, item, context)
+        
+        for b, buyer in enumerate(buyers):
+            if shared_base_value:
+                if cursor == len(queue):
+                    break  # Sold out
+                
+                best = queue[cursor]
+                if price_list[best] > buyer.wallet.balance or uniform_values[b] - price_list[best] <= 0:
+                    continue  # Nothing worth buying within budget
+            else:
+                # Consumer surplus = value - price; only positive, affordable deals
+                surplus = values[b] - prices
+                eligible = available & (prices <= buyer.wallet.balance) & (surplus > 0)
+                
+                if not eligible.any():
+                    continue  # Nothing worth buying within budget
+                
+                # Best surplus wins; on ties, the cheapest listing
+                candidates = cheapest_first[eligible[cheapest_first]]
+                best = candidates[np.argmax(surplus[candidates])]
             
-            if best_listing:
-                # Execute transaction
-                try:
-                    transaction = self._execute_transaction(
-                        buyer, best_listing
-                    )
-                    self.transactions.append(transaction)
-                    active_buyers.append(buyer.name)
-                    
-                    # Remove listing
-                    self.listings.remove(best_listing)
-                    
-                except Exception as e:
-                    print(f"Transaction failed: {e}")
-                    continue
+            # Execute transaction
+            try:
+                transaction = self._execute_transaction(
+                    buyer, self.listings[best]
+                )
+                self.transactions.append(transaction)
+                active_buyers.append(buyer.name)
+                available[best] = False
+                if shared_base_value:
+                    cursor += 1
+                
+            except Exception as e:
+                print(f"Transaction failed: {e}")
+                continue
+        
+        # Remove sold listings
+        self.listings = [listing for listing, unsold in zip(self.listings, available) if unsold]
         
         # Phase 3: Calculate market statistics
         return self._calculate_results(
             buyers, sellers, active_buyers
         )
     
-    def _seller_price_decision(
+    def _seller_prices(
         self,
-        seller: Any,
+        sellers: List[Any],
         item: str,
         context: Dict[str, Any]
-    ) -> float:
-        """Seller decides on listing price."""
+    ) -> np.ndarray:
+        """Every seller's listing price, decided from the trait matrix in one pass."""
         base_value = context.get("base_value", 100)
+        traits = trait_matrix(sellers)
         
-        # Personality-based pricing
+        # Personality-based pricing, first matching rule wins
         # Openness → higher prices (optimistic)
         # Neuroticism → lower prices (risk averse)
         # Conscientiousness → calculated pricing
+        markups = np.select(
+            [
+                traits[:, TRAIT_NAMES.index("openness")] > 0.7,
+                traits[:, TRAIT_NAMES.index("neuroticism")] > 0.7,
+                traits[:, TRAIT_NAMES.index("conscientiousness")] > 0.7,
+            ],
+            [
+                1.3,  # 30% premium
+                0.9,  # 10% discount
+                1.1,  # Careful 10% markup
+            ],
+            default=1.0  # Market rate
+        )
         
-        if seller.traits.openness > 0.7:
-            return base_value * 1.3  # 30% premium
-        elif seller.traits.neuroticism > 0.7:
-            return base_value * 0.9  # 10% discount
-        elif seller.traits.conscientiousness > 0.7:
-            return base_value * 1.1  # Careful 10% markup
-        else:
-            return base_value  # Market rate
+        return base_value * markups
     
-    def _buyer_purchase_decision(
+    def _valuation_matrix(
         self,
-        buyer: Any,
-        listings: List[Listing],
+        buyers: List[Any],
+        prices: np.ndarray,
         item: str,
         context: Dict[str, Any]
-    ) -> Optional[Listing]:
-        """Buyer decides which listing to purchase."""
-        if not listings:
-            return None
-        
-        # Calculate utility for each listing
-        best_listing = None
-        best_surplus = -float('inf')  # Consumer surplus = value - price
-        
-        for listing in listings:
-            # Calculate value to buyer
-            value = buyer.calculate_utility(
-                item=item,
-                base_value=context.get("base_value", listing.price * 1.2),
-                context=context
-            )
-            
-            surplus = value - listing.price
-            
-            # Buy if positive surplus and best deal
-            if surplus > 0 and surplus > best_surplus:
-                best_surplus = surplus
-                best_listing = listing
-        
-        return best_listing
+    ) -> np.ndarray:
+        """Each buyer's value for each listing, shape (buyers, listings)."""
+        # Without a shared base value each listing is valued relative to its own price
+        return calculate_utility_batch(buyers, item, prices[:, None] * 1.2, context).T
     
     def _execute_transaction(
         self,
@@ -270,18 +279,19 @@ class Marketplace:
             )
         
         prices = [t.price for t in self.transactions]
+        active = set(active_buyers)
         
         return MarketResult(
             transactions=self.transactions,
-            avg_price=statistics.mean(prices) if prices else None,
-            price_range=(min(prices), max(prices)) if prices else None,
+            avg_price=statistics.mean(prices),
+            price_range=(min(prices), max(prices)),
             total_volume=len(self.transactions),
-            active_buyers=len(set(active_buyers)),
-            active_sellers=len(set(t.seller_id for t in self.transactions)),
+            active_buyers=len(active),
+            active_sellers=len({t.seller_id for t in self.transactions}),
             unsold_listings=self.listings,
             unmatched_buyers=[
                 b.name for b in buyers 
-                if b.name not in active_buyers
+                if b.name not in active
             ]
         )
 
@@ -291,7 +301,7 @@ def simulate_market(
     sellers: List[Any],
     item: str,
     base_value: float = 100,
-    context: Dict[str, Any] = {}
+    context: Optional[Dict[str, Any]] = None
 ) -> MarketResult:
     """
     Convenience function to simulate a market.
@@ -309,10 +319,8 @@ def simulate_market(
     """
     market = Marketplace()
     
-    context.update({
-        "base_value": base_value,
-        "item": item
-    })
+    # Fresh dict: the caller's context (and no shared default) is never mutated
+    context = {**(context or {}), "base_value": base_value, "item": item}
     
     return market.simulate_trading(buyers, sellers, item, context)
 
@@ -331,26 +339,16 @@ def analyze_price_sensitivity(
     """
     min_price, max_price = price_range
     step_size = (max_price - min_price) / steps
+    prices = min_price + np.arange(steps + 1) * step_size
     
-    demand_curve = {}
+    # Value of the item to every buyer at every price point in one batch:
+    # a column of base values gives a (prices, buyers) table
+    # (simple utility calculation, assuming some value premium)
+    values = calculate_utility_batch(buyers, item, prices[:, None] * 1.5, {})
+    balances = np.fromiter((buyer.wallet.balance for buyer in buyers), dtype=np.float64, count=len(buyers))
     
-    for i in range(steps + 1):
-        price = min_price + (i * step_size)
-        
-        # Count how many buyers would purchase at this price
-        quantity = 0
-        
-        for buyer in buyers:
-            # Simple utility calculation
-            value = buyer.calculate_utility(
-                item=item,
-                base_value=price * 1.5,  # Assume some value premium
-                context={}
-            )
-            
-            if value > price and buyer.wallet.can_afford(price):
-                quantity += 1
-        
-        demand_curve[round(price, 2)] = quantity
+    # Count how many buyers would purchase at each price
+    would_buy = (values > prices[:, None]) & (balances >= prices[:, None])
+    quantities = would_buy.sum(axis=1)
     
-    return demand_curve
+    return {round(float(price), 2): int(quantity) for price, quantity in zip(prices, quantities)}
@@ -8,6 +8,7 @@ with personality-driven negotiation strategies.
 from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
 from enum import Enum
+from functools import lru_cache
 from simulacrum.protocols.base import Protocol
 
 
@@ -135,58 +136,39 @@ class NegotiationProtocol(Protocol):
                 initial_ask, initial_bid, offers
             )
         
-        # Multi-round negotiation
-        current_ask = initial_ask
-        current_bid = initial_bid
+        # Multi-round negotiation: concession styles are fixed per negotiator,
+        # so the rounds themselves run on plain floats
+        prices, final_ask, final_bid, converged = _negotiation_path(
+            initial_ask,
+            initial_bid,
+            self._seller_concession_rate(seller),
+            self._buyer_concession_rate(buyer),
+            seller_reserve,
+            buyer_max,
+            self.max_rounds,
+            self.min_price_movement,
+            self.convergence_threshold
+        )
         
-        for round_num in range(1, self.max_rounds + 1):
-            # Seller's turn to counter
-            current_ask = self._seller_counter(
-                seller, buyer, item, current_ask, current_bid,
-                seller_reserve, round_num, context
-            )
-            
+        # Prices alternate seller, buyer within each round
+        for i, price in enumerate(prices):
+            counterpart, role = (seller, "seller") if i % 2 == 0 else (buyer, "buyer")
             offers.append(
                 Offer(
-                    round=round_num,
-                    agent_id=seller.name,
-                    role="seller",
-                    price=current_ask,
-                    message=f"Counter-offer"
-                )
-            )
-            
-            # Check convergence
-            if abs(current_ask - current_bid) <= self.convergence_threshold:
-                final_price = (current_ask + current_bid) / 2
-                return self._create_success_result(
-                    buyer, seller, item, final_price,
-                    initial_ask, initial_bid, offers
+                    round=i // 2 + 1,
+                    agent_id=counterpart.name,
+                    role=role,
+                    price=price,
+                    message="Counter-offer"
                 )
-            
-            # Buyer's turn to counter
-            current_bid = self._buyer_counter(
-                buyer, seller, item, current_bid, current_ask,
-                buyer_max, round_num, context
             )
-            
-            offers.append(
-                Offer(
-                    round=round_num,
-                    agent_id=buyer.name,
-                    role="buyer",
-                    price=current_bid,
-                    message=f"Counter-offer"
-                )
+        
+        if converged:
+            final_price = (final_ask + final_bid) / 2
+            return self._create_success_result(
+                buyer, seller, item, final_price,
+                initial_ask, initial_bid, offers
             )
-            
-            # Check convergence again
-            if abs(current_ask - current_bid) <= self.convergence_threshold:
-                final_price = (current_ask + current_bid) / 2
-                return self._create_success_result(
-                    buyer, seller, item, final_price,
-                    initial_ask, initial_bid, offers
-                )
         
         # Timeout: no agreement after max rounds
         return NegotiationResult(
@@ -242,85 +224,26 @@ class NegotiationProtocol(Protocol):
         
         return max_price * bid_factor
     
-    def _seller_counter(
-        self,
-        seller: Any,
-        buyer: Any,
-        item: str,
-        current_ask: float,
-        buyer_bid: float,
-        reserve: float,
-        round_num: int,
-        context: Dict[str, Any]
-    ) -> float:
-        """Seller makes counter-offer."""
-        gap = current_ask - buyer_bid
-        
-        # Concession size based on personality
+    def _seller_concession_rate(self, seller: Any) -> float:
+        """Fraction of the gap the seller gives up per round, before pressure."""
         # High agreeableness → larger concessions
         # High conscientiousness → steady, calculated moves
-        # High neuroticism → smaller concessions (fear of loss)
-        
+        # Otherwise → smaller concessions (fear of loss)
         if seller.traits.agreeableness > 0.6:
-            concession_rate = 0.4  # Move 40% toward buyer
+            return 0.4  # Move 40% toward buyer
         elif seller.traits.conscientiousness > 0.6:
-            concession_rate = 0.3  # Steady 30% moves
+            return 0.3  # Steady 30% moves
         else:
-            concession_rate = 0.2  # Cautious 20% moves
-        
-        # Adjust for pressure (later rounds = more concession)
-        pressure_factor = round_num / self.max_rounds
-        concession_rate *= (1 + pressure_factor)
-        
-        new_ask = current_ask - (gap * concession_rate)
-        
-        # Don't go below reserve
-        new_ask = max(new_ask, reserve)
-        
-        # Ensure minimum movement
-        if abs(new_ask - current_ask) < self.min_price_movement:
-            new_ask = current_ask - self.min_price_movement
-            new_ask = max(new_ask, reserve)
-        
-        return new_ask
+            return 0.2  # Cautious 20% moves
     
-    def _buyer_counter(
-        self,
-        buyer: Any,
-        seller: Any,
-        item: str,
-        current_bid: float,
-        seller_ask: float,
-        max_price: float,
-        round_num: int,
-        context: Dict[str, Any]
-    ) -> float:
-        """Buyer makes counter-offer."""
-        gap = seller_ask - current_bid
-        
-        # Concession size based on personality
+    def _buyer_concession_rate(self, buyer: Any) -> float:
+        """Fraction of the gap the buyer gives up per round, before pressure."""
         if buyer.traits.agreeableness > 0.6:
-            concession_rate = 0.4  # Generous moves
+            return 0.4  # Generous moves
         elif buyer.traits.openness > 0.6:
-            concession_rate = 0.35  # Creative, flexible
+            return 0.35  # Creative, flexible
         else:
-            concession_rate = 0.25  # Conservative moves
-        
-        # Later rounds = more pressure to close
-        pressure_factor = round_num / self.max_rounds
-        concession_rate *= (1 + pressure_factor)
-        
-        new_bid = current_bid + (gap * concession_rate)
-        
-        # Don't exceed max
-        new_bid = min(new_bid, max_price)
-        
-        # Ensure minimum movement
-        if abs(new_bid - current_bid) < self.min_price_movement:
-            new_bid = current_bid + self.min_price_movement
-            new_bid = min(new_bid, max_price)
-        
-        return new_bid
+            return 0.25  # Conservative moves
     
     def _create_success_result(
         self,
@@ -348,6 +271,55 @@ class NegotiationProtocol(Protocol):
         )
 
 
+@lru_cache(maxsize=1024)
+def _negotiation_path(
+    ask: float,
+    bid: float,
+    seller_rate: float,
+    buyer_rate: float,
+    seller_reserve: float,
+    buyer_max: float,
+    max_rounds: int,
+    min_price_movement: float,
+    convergence_threshold: float
+) -> Tuple[Tuple[float, ...], float, float, bool]:
+    """
+    Run the counter-offer rounds on plain floats.
+    
+    Returns the prices offered from round 1 on (seller then buyer each
+    round), the final ask and bid, and whether they converged. The path
+    is deterministic in its arguments, so results are memoized; callers
+    build fresh Offer objects from the returned tuple.
+    """
+    prices = []
+    
+    for round_num in range(1, max_rounds + 1):
+        # Later rounds = more pressure to close
+        pressure = 1 + round_num / max_rounds
+        
+        # Seller concedes toward the bid, never below reserve
+        new_ask = max(ask - (ask - bid) * (seller_rate * pressure), seller_reserve)
+        if abs(new_ask - ask) < min_price_movement:
+            new_ask = max(ask - min_price_movement, seller_reserve)
+        ask = new_ask
+        prices.append(ask)
+        
+        if abs(ask - bid) <= convergence_threshold:
+            return tuple(prices), ask, bid, True
+        
+        # Buyer concedes toward the ask, never above max
+        new_bid = min(bid + (ask - bid) * (buyer_rate * pressure), buyer_max)
+        if abs(new_bid - bid) < min_price_movement:
+            new_bid = min(bid + min_price_movement, buyer_max)
+        bid = new_bid
+        prices.append(bid)
+        
+        if abs(ask - bid) <= convergence_threshold:
+            return tuple(prices), ask, bid, True
+    
+    return tuple(prices), ask, bid, False
+
+
 def negotiate_price(
     buyer: Any,
     seller: Any,
@@ -6,9 +6,16 @@ manage budgets, and make purchasing decisions.
 """
 
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType, MethodType, SimpleNamespace
+import numpy as np
+from simulacrum.agents.persona import TRAIT_NAMES, trait_matrix
+
+# Shared read-only stand-in for a missing context
+_EMPTY = MappingProxyType({})
 
 
 class TransactionType(str, Enum):
@@ -41,8 +48,19 @@ class Wallet(BaseModel):
     owner_id: str
     balance: float = 1000.0  # Starting balance
     currency: str = "credits"
-    transactions: List[Transaction] = []
+    transactions: List[Transaction] = Field(default_factory=list)
     spending_limit: Optional[float] = None  # Max per transaction
+    history_limit: Optional[int] = None  # Keep only the most recent N transactions (None = unbounded)
+    _dropped: int = PrivateAttr(default=0)  # Transactions trimmed by history_limit
+    
+    # Purchase aggregates, built from transactions at construction and kept up to date by _record
+    _purchases: List[Transaction] = PrivateAttr(default_factory=list)
+    _total_spent: float = PrivateAttr(default=0)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Build the purchase aggregates from any transactions passed in (e.g. when loading)."""
+        self._purchases = [t for t in self.transactions if t.type is TransactionType.PURCHASE]
+        self._total_spent = sum(t.amount for t in self._purchases)
     
     def can_afford(self, amount: float) -> bool:
         """Check if wallet has sufficient funds."""
@@ -74,7 +92,7 @@ class Wallet(BaseModel):
         self.balance -= amount
         
         transaction = Transaction(
-            id=f"tx_{len(self.transactions)+1}",
+            id=f"tx_{self._dropped + len(self.transactions)+1}",
             type=TransactionType.PURCHASE,
             amount=amount,
             counterparty=counterparty,
@@ -83,8 +101,7 @@ class Wallet(BaseModel):
             balance_after=self.balance
         )
         
-        self.transactions.append(transaction)
-        return transaction
+        return self._record(transaction)
     
     def receive(
         self,
@@ -97,7 +114,7 @@ class Wallet(BaseModel):
         self.balance += amount
         
         transaction = Transaction(
-            id=f"tx_{len(self.transactions)+1}",
+            id=f"tx_{self._dropped + len(self.transactions)+1}",
             type=TransactionType.SALE,
             amount=amount,
             counterparty=counterparty,
@@ -106,19 +123,40 @@ class Wallet(BaseModel):
             balance_after=self.balance
         )
         
+        return self._record(transaction)
+    
+    def _record(self, transaction: Transaction) -> Transaction:
+        """
+        Append a transaction, dropping the oldest ones beyond history_limit.
+        
+        This is the only way transactions should be added: it also keeps the
+        purchase list and total_spent current.
+        """
         self.transactions.append(transaction)
+        if transaction.type is TransactionType.PURCHASE:
+            self._purchases.append(transaction)
+            self._total_spent += transaction.amount
+        
+        if self.history_limit is not None and len(self.transactions) > self.history_limit:
+            excess = len(self.transactions) - self.history_limit
+            
+            # total_spent keeps counting the dropped purchases
+            dropped_purchases = sum(
+                t.type is TransactionType.PURCHASE for t in self.transactions[:excess]
+            )
+            del self.transactions[:excess]
+            del self._purchases[:dropped_purchases]
+            self._dropped += excess
+        
         return transaction
     
     def get_spending_history(self) -> List[Transaction]:
-        """Get all purchase transactions."""
-        return [t for t in self.transactions if t.type == TransactionType.PURCHASE]
+        """Get all purchase transactions (the retained ones, under history_limit)."""
+        return list(self._purchases)
     
     def total_spent(self) -> float:
         """Calculate total amount spent."""
-        return sum(
-            t.amount for t in self.transactions 
-            if t.type == TransactionType.PURCHASE
-        )
+        return self._total_spent
 
 
 class UtilityFunction(BaseModel):
@@ -136,7 +174,7 @@ class UtilityFunction(BaseModel):
     def calculate(
         self,
         agent: Any,
-        context: Dict[str, Any] = {}
+        context: Optional[Dict[str, Any]] = None
     ) -> float:
         """
         Calculate agent's utility (willingness-to-pay) for an item.
@@ -148,6 +186,7 @@ class UtilityFunction(BaseModel):
         Returns:
             Maximum price agent is willing to pay
         """
+        context = context or _EMPTY
         utility = self.base_value
         
         # Openness → values novelty and innovation
@@ -179,6 +218,59 @@ class UtilityFunction(BaseModel):
             utility += network_value * extraversion_factor
         
         return max(0, utility)  # Can't be negative
+    
+    def calculate_batch(
+        self,
+        agents: List[Any],
+        context: Optional[Dict[str, Any]] = None
+    ) -> np.ndarray:
+        """
+        Vectorized calculate() for many agents valuing the same item.
+        
+        Returns one utility per agent, computed from the (n, 5) trait matrix.
+        """
+        context = context or _EMPTY
+        return _batch_utility(
+            trait_matrix(agents),
+            self.base_value,
+            self.novelty_bonus,
+            self.risk_adjustment,
+            self.quality_premium,
+            self.social_proof_multiplier,
+            context.get("reviews", 0),
+            context.get("network_value", 0)
+        )
+
+
+def _batch_utility(
+    traits: np.ndarray,
+    base_value,
+    novelty_bonus: float,
+    risk_adjustment: float,
+    quality_premium: float,
+    social_proof: float,
+    reviews: float,
+    network_value: float
+) -> np.ndarray:
+    """UtilityFunction.calculate over an (n, 5) trait matrix; base_value may be an array."""
+    # Per-trait additive weights, in TRAIT_NAMES order
+    weights = np.zeros(len(TRAIT_NAMES))
+    weights[TRAIT_NAMES.index("openness")] = max(novelty_bonus, 0)
+    weights[TRAIT_NAMES.index("conscientiousness")] = max(quality_premium, 0)
+    weights[TRAIT_NAMES.index("neuroticism")] = risk_adjustment
+    
+    utilities = base_value + traits @ weights
+    
+    # Agreeableness → social proof effect
+    if social_proof != 1.0:
+        social_factor = traits[:, TRAIT_NAMES.index("agreeableness")] * (reviews / 100)
+        utilities *= 1 + social_factor * (social_proof - 1)
+    
+    # Extraversion → network effects
+    if network_value > 0:
+        utilities += network_value * traits[:, TRAIT_NAMES.index("extraversion")]
+    
+    return np.maximum(utilities, 0)  # Can't be negative
 
 
 def create_economic_citizen(
@@ -201,38 +293,81 @@ def create_economic_citizen(
     citizen.wallet = Wallet(owner_id=name, balance=initial_balance)
     citizen.purchase_history = []
     
-    # Bind helper methods
-    citizen.calculate_utility = lambda item, base_value, context={}: calculate_utility(
-        citizen, item, base_value, context
-    )
-    citizen.willing_to_buy = lambda item, price, value=None, context={}: willing_to_buy(
-        citizen, item, price, value, context
-    )
-    citizen.make_purchase = lambda item, price, seller, context={}: make_purchase(
-        citizen, item, price, seller, context
-    )
-    citizen.evaluate_price = lambda item, offered_price, context={}: evaluate_price(
-        citizen, item, offered_price, context
-    )
+    # Bind helper methods (the module functions take the agent first)
+    citizen.calculate_utility = MethodType(calculate_utility, citizen)
+    citizen.willing_to_buy = MethodType(willing_to_buy, citizen)
+    citizen.make_purchase = MethodType(make_purchase, citizen)
+    citizen.evaluate_price = MethodType(evaluate_price, citizen)
     
     return citizen
 
 
+# Context keys (with defaults) that feed into a utility calculation
+UTILITY_CONTEXT_KEYS = (
+    ("risk_adjustment", 0),
+    ("novelty_bonus", 0),
+    ("social_proof", 1.0),
+    ("quality_premium", 0),
+    ("reviews", 0),
+    ("network_value", 0),
+)
+
+
 # Helper function implementations
-def calculate_utility(agent, item, base_value, context={}):
-    """Calculate utility for an agent."""
+def calculate_utility(agent, item, base_value, context=None):
+    """Calculate utility for an agent (memoized on the inputs that affect it)."""
+    context = context or _EMPTY
+    traits = tuple(getattr(agent.traits, trait) for trait in TRAIT_NAMES)
+    inputs = tuple(context.get(key, default) for key, default in UTILITY_CONTEXT_KEYS)
+    
+    try:
+        return _cached_utility(base_value, traits, inputs)
+    except TypeError:  # Unhashable context value - compute directly
+        return _utility(base_value, traits, inputs)
+
+
+def _utility(base_value, traits, inputs):
+    """Utility from a trait tuple and UTILITY_CONTEXT_KEYS-ordered inputs."""
+    risk_adjustment, novelty_bonus, social_proof, quality_premium, reviews, network_value = inputs
+    
     utility_func = UtilityFunction(
         base_value=base_value,
-        risk_adjustment=context.get("risk_adjustment", 0),
-        novelty_bonus=context.get("novelty_bonus", 0),
-        social_proof_multiplier=context.get("social_proof", 1.0),
-        quality_premium=context.get("quality_premium", 0)
+        risk_adjustment=risk_adjustment,
+        novelty_bonus=novelty_bonus,
+        social_proof_multiplier=social_proof,
+        quality_premium=quality_premium
     )
-    return utility_func.calculate(agent, context)
+    agent = SimpleNamespace(traits=SimpleNamespace(**dict(zip(TRAIT_NAMES, traits))))
+    return utility_func.calculate(agent, {"reviews": reviews, "network_value": network_value})
 
 
-def willing_to_buy(agent, item, price, value=None, context={}):
+_cached_utility = lru_cache(maxsize=4096)(_utility)
+
+
+def calculate_utility_batch(agents, item, base_value, context=None) -> np.ndarray:
+    """
+    Calculate utility for many agents valuing the same item in one pass.
+    
+    Same result as calling calculate_utility() per agent, but the trait
+    terms are a single matrix-vector product over the (n, 5) trait matrix.
+    A (k, 1) column of base values yields a (k, n) table in the same pass.
+    """
+    context = context or _EMPTY
+    return _batch_utility(
+        trait_matrix(agents),
+        base_value,
+        context.get("novelty_bonus", 0),
+        context.get("risk_adjustment", 0),
+        context.get("quality_premium", 0),
+        context.get("social_proof", 1.0),
+        context.get("reviews", 0),
+        context.get("network_value", 0)
+    )
+
+
+def willing_to_buy(agent, item, price, value=None, context=None):
     """Determine if agent willing to buy."""
+    context = context or _EMPTY
     if not agent.wallet.can_afford(price):
         return False
     
@@ -243,19 +378,25 @@ def willing_to_buy(agent, item, price, value=None, context={}):
     if value <= price:
         return False
     
-    # Personality-based adjustments
-    if agent.traits.conscientiousness > 0.7 and value < price * 1.2:
-        return False
-    if agent.traits.neuroticism > 0.7 and value < price * 1.3:
-        return False
-    if agent.traits.openness < 0.3 and value < price * 1.5:
-        return False
+    # Personality-based adjustments: once value is above price, only the
+    # largest applicable markup can still reject it
+    traits = agent.traits
+    if traits.openness < 0.3:
+        markup = 1.5
+    elif traits.neuroticism > 0.7:
+        markup = 1.3
+    elif traits.conscientiousness > 0.7:
+        markup = 1.2
+    else:
+        return True
     
-    return True
+    return value >= price * markup
 
 
-def make_purchase(agent, item, price, seller, context={}):
+def make_purchase(agent, item, price, seller, context=None):
     """Execute purchase."""
+    if context is None:
+        context = {}  # Kept on the purchase record, so give each its own
     transaction = agent.wallet.spend(
         amount=price,
         counterparty=seller,
@@ -281,8 +422,9 @@ def make_purchase(agent, item, price, seller, context={}):
     return purchase_record
 
 
-def evaluate_price(agent, item, offered_price, context={}):
+def evaluate_price(agent, item, offered_price, context=None):
     """Evaluate price using agent reasoning."""
+    context = context or _EMPTY
     base_value = context.get("base_value", offered_price * 1.2)
     my_value = calculate_utility(agent, item, base_value, context)
     
@@ -15,6 +15,8 @@ from datetime import datetime
 from enum import Enum
 import statistics
 
+import numpy as np
+
 
 class OutcomeType(str, Enum):
     """Types of outcomes from decisions."""
@@ -46,6 +48,7 @@ class Strategy(BaseModel):
     """A learned strategy for a type of situation."""
     context_type: str
     description: str
+    choice: str = ""  # The decision choice this strategy stands for
     success_rate: float = 0.0
     times_used: int = 0
     total_reward: float = 0.0
@@ -63,39 +66,59 @@ class AdaptiveLearner:
     - Observation: Learn from others' outcomes
     """
     
-    def __init__(self, agent: Any, learning_rate: float = 0.1):
+    def __init__(
+        self,
+        agent: Any,
+        learning_rate: float = 0.1,
+        history_limit: Optional[int] = None,
+        seed: Optional[int] = None
+    ):
         """
         Initialize learning system.
         
         Args:
             agent: The agent who will learn
             learning_rate: How quickly to update from feedback (0.0-1.0)
+            history_limit: Keep only the most recent N decisions and outcomes
+                (None = unbounded). Counters and totals still cover everything.
+            seed: Seed for the explore/exploit coin (None = unseeded)
         """
         self.agent = agent
         self.learning_rate = learning_rate
+        self.history_limit = history_limit
+        self._rng = np.random.default_rng(seed)
         
-        # Track decisions and outcomes
+        # Track decisions and outcomes (decisions are added through record_decision)
         self.decisions: List[Decision] = []
         self.outcomes: List[Outcome] = []
+        self._dropped_decisions = 0
+        self._decision_index: Dict[str, Decision] = {}  # id -> first decision recorded with it
         
-        # Learned strategies
+        # Learned strategies (added through _add_strategy), plus their keys by context
         self.strategies: Dict[str, Strategy] = {}
+        self._by_context: Dict[str, List[str]] = {}
         
         # Performance tracking
         self.success_count = 0
         self.failure_count = 0
+        self._total_reward = 0.0
     
     def record_decision(
         self,
         context: str,
         choice: str,
         reasoning: str = "",
-        confidence: float = 0.5
+        confidence: float = 0.5,
+        timestamp: Optional[datetime] = None
     ) -> Decision:
-        """Record a decision for future learning."""
+        """
+        Record a decision for future learning.
+        
+        Pass timestamp to share one clock reading across a simulation tick.
+        """
         decision = Decision(
-            id=f"dec_{len(self.decisions)+1}",
-            timestamp=datetime.now(),
+            id=f"dec_{self._total_decisions()+1}",
+            timestamp=timestamp or datetime.now(),
             context=context,
             choice=choice,
             reasoning=reasoning,
@@ -103,6 +126,16 @@ class AdaptiveLearner:
         )
         
         self.decisions.append(decision)
+        self._decision_index.setdefault(decision.id, decision)
+        
+        if self.history_limit is not None and len(self.decisions) > self.history_limit:
+            excess = len(self.decisions) - self.history_limit
+            for old in self.decisions[:excess]:
+                if self._decision_index.get(old.id) is old:
+                    del self._decision_index[old.id]
+            del self.decisions[:excess]
+            self._dropped_decisions += excess
+        
         return decision
     
     def record_outcome(
@@ -110,16 +143,18 @@ class AdaptiveLearner:
         decision_id: str,
         outcome_type: OutcomeType,
         reward: float = 0.0,
-        feedback: str = ""
+        feedback: str = "",
+        timestamp: Optional[datetime] = None
     ) -> Outcome:
         """
         Record outcome and learn from it.
         
         This updates strategies and may affect personality traits.
+        Pass timestamp to share one clock reading across a simulation tick.
         """
         outcome = Outcome(
             decision_id=decision_id,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             outcome_type=outcome_type,
             reward=reward,
             feedback=feedback
@@ -128,23 +163,28 @@ class AdaptiveLearner:
         self.outcomes.append(outcome)
         
         # Update performance counters
-        if outcome_type == OutcomeType.SUCCESS:
+        if outcome.outcome_type is OutcomeType.SUCCESS:
             self.success_count += 1
-        elif outcome_type == OutcomeType.FAILURE:
+        elif outcome.outcome_type is OutcomeType.FAILURE:
             self.failure_count += 1
+        self._total_reward += reward
         
         # Learn from outcome
         self._learn_from_outcome(decision_id, outcome)
         
+        if self.history_limit is not None and len(self.outcomes) > self.history_limit:
+            del self.outcomes[:len(self.outcomes) - self.history_limit]
+        
         return outcome
     
+    def _total_decisions(self) -> int:
+        """Decisions recorded so far, including any dropped by history_limit."""
+        return self._dropped_decisions + len(self.decisions)
+    
     def _learn_from_outcome(self, decision_id: str, outcome: Outcome):
         """Update strategies based on outcome."""
         # Find the decision
-        decision = next(
-            (d for d in self.decisions if d.id == decision_id),
-            None
-        )
+        decision = self._decision_index.get(decision_id)
         
         if not decision:
             return
@@ -152,35 +192,27 @@ class AdaptiveLearner:
         # Update or create strategy for this context
         strategy_key = f"{decision.context}:{decision.choice}"
         
-        if strategy_key not in self.strategies:
-            self.strategies[strategy_key] = Strategy(
+        strategy = self.strategies.get(strategy_key)
+        if strategy is None:
+            strategy = self._add_strategy(strategy_key, Strategy(
                 context_type=decision.context,
-                description=f"Choose '{decision.choice}' in {decision.context}"
-            )
-        
-        strategy = self.strategies[strategy_key]
+                description=f"Choose '{decision.choice}' in {decision.context}",
+                choice=decision.choice
+            ))
         
         # Update strategy statistics
         strategy.times_used += 1
         strategy.total_reward += outcome.reward
-        strategy.last_used = datetime.now()
-        
-        # Update success rate
-        if outcome.outcome_type == OutcomeType.SUCCESS:
-            strategy.success_rate = (
-                (strategy.success_rate * (strategy.times_used - 1) + 1.0) 
-                / strategy.times_used
-            )
-        elif outcome.outcome_type == OutcomeType.FAILURE:
-            strategy.success_rate = (
-                (strategy.success_rate * (strategy.times_used - 1) + 0.0) 
-                / strategy.times_used
-            )
+        strategy.last_used = outcome.timestamp
+        
+        # Update success rate (running mean: success=1, failure=0, mixed=0.5)
+        if outcome.outcome_type is OutcomeType.SUCCESS:
+            x = 1.0
+        elif outcome.outcome_type is OutcomeType.FAILURE:
+            x = 0.0
         else:  # Mixed
-            strategy.success_rate = (
-                (strategy.success_rate * (strategy.times_used - 1) + 0.5) 
-                / strategy.times_used
-            )
+            x = 0.5
+        strategy.success_rate += (x - strategy.success_rate) / strategy.times_used
     
     def get_best_strategy(self, context: str) -> Optional[Strategy]:
         """
@@ -189,8 +221,8 @@ class AdaptiveLearner:
         "Best" is determined by success rate and total reward.
         """
         relevant_strategies = [
-            s for s in self.strategies.values()
-            if s.context_type == context and s.times_used > 0
+            s for s in self._strategies_in(context)
+            if s.times_used > 0
         ]
         
         if not relevant_strategies:
@@ -203,69 +235,110 @@ class AdaptiveLearner:
         
         return max(relevant_strategies, key=score)
     
-    def should_explore(self) -> bool:
+    def _add_strategy(self, key: str, strategy: Strategy) -> Strategy:
+        """Register a new strategy under its key and its context."""
+        if key not in self.strategies:
+            self._by_context.setdefault(strategy.context_type, []).append(key)
+        self.strategies[key] = strategy
+        return strategy
+    
+    def _strategies_in(self, context: str) -> List[Strategy]:
+        """Strategies for one context, in the order they were learned."""
+        # Only keys are grouped; the Strategy objects always come from self.strategies
+        return [
+            self.strategies[key] for key in self._by_context.get(context, [])
+            if key in self.strategies
+        ]
+    
+    def should_explore(self, rng: Optional[np.random.Generator] = None) -> bool:
         """
         Decide whether to explore (try new things) or exploit (use best known).
         
         Higher openness → more exploration
         More failures recently → more exploration
+        The coin comes from rng if given, else from the learner's own seeded generator.
+        """
+        rng = rng or self._rng
+        return rng.random() < self._exploration_rate()
+    
+    @staticmethod
+    def should_explore_batch(
+        learners: List['AdaptiveLearner'],
+        rng: Optional[np.random.Generator] = None
+    ) -> List[bool]:
         """
+        should_explore for a whole population, drawing all the coins at once.
+        
+        Pass a seeded rng for reproducible runs.
+        """
+        rng = rng or np.random.default_rng()
+        rates = [learner._exploration_rate() for learner in learners]
+        return (rng.random(len(learners)) < rates).tolist()
+    
+    def _exploration_rate(self) -> float:
+        """Chance of exploring on the next decision."""
         # Base exploration rate from openness
         exploration_rate = self.agent.traits.openness * 0.3
         
         # If recent performance is poor, explore more
-        recent_decisions = self.decisions[-10:]
+        recent_ids = {d.id for d in self.decisions[-10:]}
         recent_outcomes = [
             o for o in self.outcomes
-            if any(o.decision_id == d.id for d in recent_decisions)
+            if o.decision_id in recent_ids
         ]
         
         if recent_outcomes:
             recent_success_rate = sum(
                 1 for o in recent_outcomes 
-                if o.outcome_type == OutcomeType.SUCCESS
+                if o.outcome_type is OutcomeType.SUCCESS
             ) / len(recent_outcomes)
             
             # Poor performance → increase exploration
             if recent_success_rate < 0.4:
                 exploration_rate += 0.2
         
-        # Random exploration decision
-        import random
-        return random.random() < exploration_rate
+        return exploration_rate
     
     def learn_from_observation(
         self,
         other_agent: 'AdaptiveLearner',
-        context: str
+        context: Optional[str] = None
     ):
         """
         Learn from observing another agent's experiences.
         
         Vicarious learning: observe others' outcomes and adopt their strategies.
+        With no context, strategies from every context are considered.
         """
         # Find successful strategies from other agent in this context
-        other_strategies = [
-            s for s in other_agent.strategies.values()
-            if s.context_type == context and s.success_rate > 0.6
-        ]
-        
-        for strategy in other_strategies:
+        self._adopt(other_agent._successful_strategies(context))
+    
+    def _successful_strategies(self, context: Optional[str] = None) -> List[Strategy]:
+        """Strategies worth passing on to observers (success rate above 0.6)."""
+        strategies = self.strategies.values() if context is None else self._strategies_in(context)
+        return [s for s in strategies if s.success_rate > 0.6]
+    
+    def _adopt(self, observed: List[Strategy]) -> List[Strategy]:
+        """Adopt observed strategies we don't have yet; returns the new ones."""
+        adopted = []
+        for strategy in observed:
             strategy_key = f"{strategy.context_type}:{strategy.description}"
             
             # If we don't have this strategy, adopt it (with reduced confidence)
             if strategy_key not in self.strategies:
-                self.strategies[strategy_key] = Strategy(
+                adopted.append(self._add_strategy(strategy_key, Strategy(
                     context_type=strategy.context_type,
                     description=strategy.description,
+                    choice=strategy.choice,
                     success_rate=strategy.success_rate * 0.7,  # Discount observed success
                     times_used=0
-                )
+                )))
+        return adopted
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get summary of learning performance."""
-        total_decisions = len(self.decisions)
-        total_rewards = sum(o.reward for o in self.outcomes)
+        total_decisions = self._total_decisions()
+        total_rewards = self._total_reward
         
         if total_decisions == 0:
             return {
@@ -296,6 +369,7 @@ class AdaptiveLearner:
         return {
             "context": best.context_type,
             "description": best.description,
+            "choice": best.choice,
             "success_rate": round(best.success_rate, 2),
             "times_used": best.times_used,
             "avg_reward": round(best.total_reward / best.times_used, 2) if best.times_used > 0 else 0
@@ -312,9 +386,10 @@ class PopulationLearning:
     - Strategy convergence or divergence
     """
     
-    def __init__(self, learners: List[AdaptiveLearner]):
+    def __init__(self, learners: List[AdaptiveLearner], seed: Optional[int] = None):
         self.learners = learners
         self.generation = 0
+        self._rng = np.random.default_rng(seed)
     
     def share_knowledge(self, interaction_probability: float = 0.3):
         """
@@ -322,23 +397,32 @@ class PopulationLearning:
         
         Models cultural transmission of knowledge.
         """
-        import random
+        others = len(self.learners) - 1
+        if others < 1:
+            return
         
-        for learner in self.learners:
-            if random.random() < interaction_probability:
-                # Pick another agent to observe
-                other = random.choice(
-                    [l for l in self.learners if l != learner]
-                )
+        # Draw who interacts, and with whom, for the whole round at once
+        interacts = (self._rng.random(len(self.learners)) < interaction_probability).tolist()
+        partners = self._rng.integers(0, others, size=len(self.learners)).tolist()
+        
+        # Each observed agent's successful strategies, filtered once per round
+        successful: Dict[int, List[Strategy]] = {}
+        
+        for i, learner in enumerate(self.learners):
+            if interacts[i]:
+                # Pick another agent to observe: index into "everyone but me"
+                j = partners[i]
+                if j >= i:
+                    j += 1
+                if j not in successful:
+                    successful[j] = self.learners[j]._successful_strategies()
                 
                 # Share knowledge about all contexts
-                contexts = set(
-                    s.context_type 
-                    for s in other.strategies.values()
-                )
+                adopted = learner._adopt(successful[j])
                 
-                for context in contexts:
-                    learner.learn_from_observation(other, context)
+                # Keep our own snapshot current for anyone observing us later
+                if i in successful:
+                    successful[i].extend(s for s in adopted if s.success_rate > 0.6)
     
     def get_population_statistics(self) -> Dict[str, Any]:
         """Analyze learning across the population."""
@@ -346,8 +430,8 @@ class PopulationLearning:
             return {}
         
         total_strategies = sum(len(l.strategies) for l in self.learners)
-        avg_success_rate = statistics.mean(
-            l.success_count / max(len(l.decisions), 1)
+        avg_success_rate = statistics.fmean(
+            l.success_count / max(l._total_decisions(), 1)
             for l in self.learners
         )
         
@@ -390,7 +474,9 @@ class PopulationLearning:
 
 def create_adaptive_learner(
     agent: Any,
-    learning_rate: float = 0.1
+    learning_rate: float = 0.1,
+    history_limit: Optional[int] = None,
+    seed: Optional[int] = None
 ) -> AdaptiveLearner:
     """
     Add learning capabilities to an agent.
@@ -408,4 +494,4 @@ def create_adaptive_learner(
         # Next time, use learned strategy
         best = learner.get_best_strategy("pricing")
     """
-    return AdaptiveLearner(agent, learning_rate)
+    return AdaptiveLearner(agent, learning_rate, history_limit, seed)
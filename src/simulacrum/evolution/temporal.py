@@ -13,7 +13,8 @@ from typing import List, Dict, Any, Optional
 from pydantic import BaseModel, Field
 from datetime import datetime, timedelta
 from enum import Enum
-import statistics
+import numpy as np
+from simulacrum.agents.persona import TRAIT_NAMES, trait_matrix
 
 
 class ExperienceType(str, Enum):
@@ -167,6 +168,28 @@ class TemporalAgent:
         # Update agent's actual trait
         setattr(self.agent.traits, trait_name, new_value)
     
+    def _adjust_traits(self, deltas: np.ndarray):
+        """
+        Adjust all five traits at once; deltas are ordered as TRAIT_NAMES.
+        
+        Same drift and [0, 1] clamping as _adjust_trait, computed as one
+        vector step.
+        """
+        evolutions = [self.trait_evolution[trait_name] for trait_name in TRAIT_NAMES]
+        current = np.array([evolution.current_value for evolution in evolutions])
+        
+        changes = deltas * self.drift_rate
+        new_values = np.clip(current + changes, 0.0, 1.0)
+        
+        now = datetime.now()
+        for trait_name, evolution, change, new_value in zip(
+            TRAIT_NAMES, evolutions, changes.tolist(), new_values.tolist()
+        ):
+            evolution.current_value = new_value
+            evolution.total_drift += abs(change)
+            evolution.history.append((now, new_value))
+            setattr(self.agent.traits, trait_name, new_value)
+    
     def apply_social_influence(
         self,
         influencer: 'TemporalAgent',
@@ -191,13 +214,9 @@ class TemporalAgent:
         # Agreeableness makes agents more susceptible to influence
         susceptibility = self.agent.traits.agreeableness * strength
         
-        for trait_name in self.trait_evolution.keys():
-            my_value = getattr(self.agent.traits, trait_name)
-            their_value = getattr(influencer.agent.traits, trait_name)
-            
-            # Shift slightly toward influencer's value
-            delta = (their_value - my_value) * susceptibility * 0.1
-            self._adjust_trait(trait_name, delta)
+        # Shift every trait slightly toward the influencer's value
+        gap = np.asarray(influencer.agent.traits) - np.asarray(self.agent.traits)
+        self._adjust_traits(gap * susceptibility * 0.1)
     
     def decay_memories(self, days_elapsed: float = 1.0):
         """
@@ -346,15 +365,11 @@ class LongTermSimulation:
         
         Returns standard deviation (lower = more convergence).
         """
-        values = [
-            getattr(agent.agent.traits, trait_name)
-            for agent in self.agents
-        ]
-        
-        if len(values) < 2:
+        if len(self.agents) < 2:
             return 0.0
         
-        return statistics.stdev(values)
+        values = np.array([getattr(agent.agent.traits, trait_name) for agent in self.agents])
+        return float(values.std(ddof=1))
     
     def analyze_evolution(self) -> Dict[str, Any]:
         """Analyze how the population has evolved."""
@@ -366,39 +381,34 @@ class LongTermSimulation:
             "most_stable_agent": None
         }
         
-        # Trait convergence
-        for trait in ["openness", "conscientiousness", "extraversion", "agreeableness", "neuroticism"]:
-            analysis["trait_convergence"][trait] = round(
-                self.get_trait_convergence(trait), 3
-            )
+        # Trait convergence: per-trait spread across the population
+        if len(self.agents) < 2:
+            spreads = np.zeros(len(TRAIT_NAMES))
+        else:
+            spreads = trait_matrix([a.agent for a in self.agents]).std(axis=0, ddof=1)
+        
+        for trait, spread in zip(TRAIT_NAMES, spreads.tolist()):
+            analysis["trait_convergence"][trait] = round(spread, 3)
         
-        # Most evolved agent (highest total drift)
         if self.agents:
-            most_evolved = max(
-                self.agents,
-                key=lambda a: sum(
-                    ev.total_drift for ev in a.trait_evolution.values()
-                )
-            )
+            # Total drift per agent (rows) summed over its traits
+            drifts = np.array([
+                [a.trait_evolution[trait].total_drift for trait in TRAIT_NAMES]
+                for a in self.agents
+            ]).sum(axis=1)
+            
+            # Most evolved agent (highest total drift)
+            most_evolved = int(drifts.argmax())
             analysis["most_evolved_agent"] = {
-                "name": most_evolved.agent.name,
-                "total_drift": round(sum(
-                    ev.total_drift for ev in most_evolved.trait_evolution.values()
-                ), 3)
+                "name": self.agents[most_evolved].agent.name,
+                "total_drift": round(float(drifts[most_evolved]), 3)
             }
             
             # Most stable agent (lowest total drift)
-            most_stable = min(
-                self.agents,
-                key=lambda a: sum(
-                    ev.total_drift for ev in a.trait_evolution.values()
-                )
-            )
+            most_stable = int(drifts.argmin())
             analysis["most_stable_agent"] = {
-                "name": most_stable.agent.name,
-                "total_drift": round(sum(
-                    ev.total_drift for ev in most_stable.trait_evolution.values()
-                ), 3)
+                "name": self.agents[most_stable].agent.name,
+                "total_drift": round(float(drifts[most_stable]), 3)
             }
         
         return analysis
@@ -17,7 +17,8 @@ from simulacrum.protocols.base import (
 
 from simulacrum.protocols.voting import (
     VotingProtocol,
-    quick_vote
+    quick_vote,
+    aquick_vote
 )
 
 from simulacrum.protocols.jury import (
@@ -38,6 +39,7 @@ __all__ = [
     # Voting
     "VotingProtocol",
     "quick_vote",
+    "aquick_vote",
     
     # Jury
     "JuryProtocol",
@@ -83,6 +83,20 @@ class Protocol(ABC):
         """
         pass
     
+    def collect_thoughts(self, agents: List[Any], prompt: str, context: str) -> List[str]:
+        """
+        Have every agent react to the same prompt, returning responses in agent order.
+        
+        Citizens are dispatched together through one generate_batch round; any other
+        agent type falls back to calling think() on each agent in turn.
+        """
+        from simulacrum.agents.persona import Citizen
+        
+        if agents and all(isinstance(agent, Citizen) for agent in agents):
+            return Citizen.batch_think([(agent, prompt, context) for agent in agents])
+        
+        return [agent.think(prompt, context=context) for agent in agents]
+    
     def log_message(self, sender_id: str, content: str, message_type: str = "statement"):
         """Log a message in the protocol state."""
         message = ProtocolMessage(
@@ -9,7 +9,7 @@ Simulates a jury process:
 4. Final verdict with consensus tracking
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from collections import Counter
 from simulacrum.protocols.base import Protocol, ProtocolMessage
 from simulacrum.protocols.voting import VotingProtocol, ConsensusType
@@ -36,13 +36,19 @@ class JuryProtocol(Protocol):
     - Open discussion with argument exchange
     - Vote shifts based on persuasion
     - Consensus building or hung jury declaration
+    
+    Pass on_round_complete(round_num, votes) to observe the vote counts of
+    each round (0 = initial vote) as soon as that round finishes, and
+    verbose=False to silence the progress lines printed to stdout.
     """
     
     def __init__(
         self,
         max_rounds: int = 5,
         required_consensus: float = 0.75,  # 9/12 for unanimous-leaning
-        allow_hung_jury: bool = True
+        allow_hung_jury: bool = True,
+        on_round_complete: Optional[Callable[[int, Dict[str, int]], None]] = None,
+        verbose: bool = True
     ):
         super().__init__(
             name="Jury Deliberation",
@@ -51,6 +57,8 @@ class JuryProtocol(Protocol):
         self.max_rounds = max_rounds
         self.required_consensus = required_consensus
         self.allow_hung_jury = allow_hung_jury
+        self.on_round_complete = on_round_complete
+        self.verbose = verbose
     
     def validate_participation(self, agents: List[Any]) -> bool:
         """Traditionally requires 12 jurors, but flexible for simulation."""
@@ -84,11 +92,13 @@ class JuryProtocol(Protocol):
         agent_positions = {agent.name: None for agent in agents}
         
         # Round 0: Initial secret votes
-        print(f"\n[Jury Deliberation] Case: {charges}")
-        print(f"[Jury Deliberation] {len(agents)} jurors empaneled")
+        if self.verbose:
+            print(f"\n[Jury Deliberation] Case: {charges}")
+            print(f"[Jury Deliberation] {len(agents)} jurors empaneled")
         
         current_votes = self._initial_vote(agents, case_summary, evidence, charges, verdict_options)
         vote_trajectory.append(current_votes)
+        self._round_complete(0, current_votes)
         
         # Update positions
         for agent in agents:
@@ -112,7 +122,8 @@ class JuryProtocol(Protocol):
         
         # Multi-round deliberation
         for round_num in range(1, self.max_rounds + 1):
-            print(f"\n[Jury Deliberation] Round {round_num}")
+            if self.verbose:
+                print(f"\n[Jury Deliberation] Round {round_num}")
             
             # Discussion phase
             arguments = self._discussion_round(
@@ -126,6 +137,7 @@ class JuryProtocol(Protocol):
             # Re-vote after discussion
             new_votes = self._revote(agents, arguments, verdict_options)
             vote_trajectory.append(new_votes)
+            self._round_complete(round_num, new_votes)
             
             # Update positions
             for agent in agents:
@@ -207,9 +219,9 @@ REASON: [1-2 sentences explaining your reasoning]
         
         votes = Counter()
         
-        for agent in agents:
-            response = agent.think(prompt, context="Jury initial vote")
-            
+        responses = self.collect_thoughts(agents, prompt, context="Jury initial vote")
+        
+        for agent, response in zip(agents, responses):
             # Parse vote
             vote = self._parse_jury_vote(response, options)
             votes[vote] += 1
@@ -248,8 +260,9 @@ Be persuasive but respectful. Consider the evidence and the burden of proof.
 Your argument (2-3 sentences):"""
         
         # Each agent shares their argument
-        for agent in agents:
-            argument = agent.think(prompt, context="Jury deliberation argument")
+        responses = self.collect_thoughts(agents, prompt, context="Jury deliberation argument")
+        
+        for agent, argument in zip(agents, responses):
             arguments.append(f"{agent.name}: {argument}")
             
             self.log_message(
@@ -283,8 +296,9 @@ BRIEF NOTE: [Did you change your mind? Why/why not?]"""
         
         votes = Counter()
         
-        for agent in agents:
-            response = agent.think(prompt, context="Jury re-vote")
+        responses = self.collect_thoughts(agents, prompt, context="Jury re-vote")
+        
+        for agent, response in zip(agents, responses):
             vote = self._parse_jury_vote(response, options)
             votes[vote] += 1
             
@@ -319,6 +333,11 @@ BRIEF NOTE: [Did you change your mind? Why/why not?]"""
         # Default to first option if unclear
         return options[0]
     
+    def _round_complete(self, round_num: int, votes: Dict[str, int]) -> None:
+        """Notify the observer, if any, that a round's votes are in."""
+        if self.on_round_complete is not None:
+            self.on_round_complete(round_num, votes)
+    
     def _check_consensus(self, votes: Dict[str, int], total_jurors: int) -> bool:
         """Check if consensus threshold is met."""
         if not votes:
@@ -339,7 +358,9 @@ def simulate_trial(
     case_summary: str,
     charges: str,
     evidence: List[str],
-    max_rounds: int = 3
+    max_rounds: int = 3,
+    on_round_complete: Optional[Callable[[int, Dict[str, int]], None]] = None,
+    verbose: bool = True
 ) -> JuryVerdict:
     """
     Convenience function to simulate a jury trial.
@@ -353,7 +374,11 @@ def simulate_trial(
             max_rounds=3
         )
     """
-    protocol = JuryProtocol(max_rounds=max_rounds)
+    protocol = JuryProtocol(
+        max_rounds=max_rounds,
+        on_round_complete=on_round_complete,
+        verbose=verbose
+    )
     return protocol.execute(
         agents=agents,
         context={
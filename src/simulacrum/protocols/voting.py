@@ -12,6 +12,9 @@ Implements various voting mechanisms:
 
 from typing import List, Dict, Any, Optional, Tuple
 from collections import Counter, defaultdict
+import asyncio
+import numpy as np
+from simulacrum.agents.persona import TRAIT_NAMES, trait_matrix
 from simulacrum.protocols.base import (
     Protocol, 
     ConsensusType, 
@@ -26,13 +29,20 @@ class VotingProtocol(Protocol):
     
     Agents are presented with options and vote based on their
     psychological profiles and reasoning.
+    
+    aexecute() is the async counterpart of execute() for callers already
+    running an event loop. With early_stop=True (aexecute() only), votes are
+    gathered as they arrive and the calls still outstanding are cancelled as
+    soon as the outcome can no longer change (simple majority, supermajority
+    and plurality only). Uncast votes still count toward total_votes.
     """
     
     def __init__(
         self,
         consensus_type: ConsensusType = ConsensusType.SIMPLE_MAJORITY,
         allow_abstention: bool = False,
-        require_reasoning: bool = True
+        require_reasoning: bool = True,
+        early_stop: bool = False
     ):
         super().__init__(
             name="Voting Protocol",
@@ -41,6 +51,7 @@ class VotingProtocol(Protocol):
         self.consensus_type = consensus_type
         self.allow_abstention = allow_abstention
         self.require_reasoning = require_reasoning
+        self.early_stop = early_stop
     
     def validate_participation(self, agents: List[Any]) -> bool:
         """Requires at least 2 agents to vote."""
@@ -59,6 +70,49 @@ class VotingProtocol(Protocol):
         - options: List of choices
         - background: Additional context (optional)
         """
+        prompt, options = self._prepare(agents, context)
+        
+        if self.early_stop:
+            raise ValueError("early_stop needs the async API: await aexecute(...) or aquick_vote(...)")
+        
+        # Round 1: Collect votes, all agents deliberating in one batched round
+        responses = self.collect_thoughts(agents, prompt, context="Voting decision")
+        votes = self._record_votes(list(zip(agents, responses)), options)
+        
+        return self._finish(votes, agents)
+    
+    async def aexecute(
+        self,
+        agents: List[Any],
+        context: Dict[str, Any]
+    ) -> VotingResult:
+        """
+        Async execute(): agents vote concurrently through athink().
+        
+        Takes the same context as execute(). With early_stop, outstanding
+        votes are cancelled once the outcome is locked (agents without
+        athink() are polled synchronously and cannot stop early).
+        """
+        prompt, options = self._prepare(agents, context)
+        
+        # Round 1: Collect votes
+        if not all(hasattr(agent, "athink") for agent in agents):
+            # Agents without athink() vote through the regular round
+            responses = self.collect_thoughts(agents, prompt, context="Voting decision")
+            ballots = list(zip(agents, responses))
+        elif self.early_stop:
+            ballots = await self._collect_until_locked(agents, prompt, options)
+        else:
+            responses = await asyncio.gather(*[
+                agent.athink(prompt, context="Voting decision") for agent in agents
+            ])
+            ballots = list(zip(agents, responses))
+        votes = self._record_votes(ballots, options)
+        
+        return self._finish(votes, agents)
+    
+    def _prepare(self, agents: List[Any], context: Dict[str, Any]) -> Tuple[str, List[str]]:
+        """Validate the vote and build the voting prompt shared by every agent."""
         if not self.validate_participation(agents):
             raise ValueError("Voting requires at least 2 agents")
         
@@ -69,27 +123,6 @@ class VotingProtocol(Protocol):
         if not options:
             raise ValueError("Voting requires options to choose from")
         
-        # Round 1: Collect votes
-        votes = self._collect_votes(agents, question, options, background)
-        
-        # Calculate result based on consensus type
-        result = self._calculate_result(votes, agents)
-        
-        self.state.result = result
-        self.state.is_complete = True
-        
-        return result
-    
-    def _collect_votes(
-        self,
-        agents: List[Any],
-        question: str,
-        options: List[str],
-        background: str
-    ) -> List[Dict[str, Any]]:
-        """Collect votes from all agents."""
-        votes = []
-        
         # Build the voting prompt
         options_str = "\n".join([f"{i+1}. {opt}" for i, opt in enumerate(options)])
         
@@ -105,10 +138,26 @@ class VotingProtocol(Protocol):
         else:
             prompt += "Respond with just the number of your choice (1, 2, 3, etc.)"
         
-        for agent in agents:
-            # Agent deliberates and votes
-            response = agent.think(prompt, context="Voting decision")
-            
+        return prompt, options
+    
+    def _finish(self, votes: List[Dict[str, Any]], agents: List[Any]) -> VotingResult:
+        """Calculate the result based on consensus type and close the protocol."""
+        result = self._calculate_result(votes, agents, total_votes=len(agents))
+        
+        self.state.result = result
+        self.state.is_complete = True
+        
+        return result
+    
+    def _record_votes(
+        self,
+        ballots: List[Tuple[Any, str]],
+        options: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Parse each (agent, response) ballot and log it in the protocol state."""
+        votes = []
+        
+        for agent, response in ballots:
             # Parse vote and reasoning
             vote_data = self._parse_vote(response, options)
             vote_data["agent_id"] = agent.name
@@ -126,6 +175,58 @@ class VotingProtocol(Protocol):
         
         return votes
     
+    async def _collect_until_locked(
+        self,
+        agents: List[Any],
+        prompt: str,
+        options: List[str]
+    ) -> List[Tuple[Any, str]]:
+        """Collect votes as they complete, cancelling the rest once the outcome is locked."""
+        tasks = {
+            asyncio.ensure_future(agent.athink(prompt, context="Voting decision")): (i, agent)
+            for i, agent in enumerate(agents)
+        }
+        pending = set(tasks)
+        ballots = []
+        tally = Counter()
+        
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    response = task.result()
+                    ballots.append((*tasks[task], response))
+                    tally[self._parse_vote(response, options)["choice"]] += 1
+                
+                if self._outcome_locked(tally, remaining=len(pending), total=len(agents)):
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        # Report ballots in agent order, not completion order
+        return [(agent, response) for _, agent, response in sorted(ballots, key=lambda b: b[0])]
+    
+    def _outcome_locked(self, tally: Counter, remaining: int, total: int) -> bool:
+        """Whether the votes still outstanding can no longer change the result."""
+        if not tally:
+            return False
+        
+        ranked = tally.most_common(2)
+        leader = ranked[0][1]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        
+        if self.consensus_type == ConsensusType.SIMPLE_MAJORITY:
+            return leader > total / 2
+        elif self.consensus_type == ConsensusType.SUPERMAJORITY:
+            return leader >= (2 * total) / 3
+        elif self.consensus_type == ConsensusType.PLURALITY:
+            return leader > runner_up + remaining
+        
+        # Unanimous and weighted results depend on every vote
+        return False
+    
     def _parse_vote(self, response: str, options: List[str]) -> Dict[str, Any]:
         """Parse agent's vote from their response."""
         vote_data = {
@@ -179,13 +280,14 @@ class VotingProtocol(Protocol):
     def _calculate_result(
         self,
         votes: List[Dict[str, Any]],
-        agents: List[Any]
+        agents: List[Any],
+        total_votes: Optional[int] = None
     ) -> VotingResult:
         """Calculate voting result based on consensus type."""
         
-        # Count votes
+        # Count votes (total may exceed the ballots cast after an early stop)
         vote_counts = Counter([v["choice"] for v in votes])
-        total_votes = len(votes)
+        total_votes = total_votes or len(votes)
         
         # Build breakdown
         breakdown = defaultdict(list)
@@ -311,27 +413,26 @@ class VotingProtocol(Protocol):
     ) -> VotingResult:
         """Weighted voting based on agent confidence/expertise."""
         # Weight by agent conscientiousness (proxy for careful decision-making)
-        weighted_votes = defaultdict(float)
+        choices = [vote["choice"] for vote in votes]
+        options = list(dict.fromkeys(choices))  # First-seen order breaks ties
+        choice_index = np.array([options.index(choice) for choice in choices])
         
-        for vote in votes:
-            choice = vote["choice"]
-            agent = vote["agent"]
-            
-            # Weight by conscientiousness (more careful = more weight)
-            weight = agent.traits.conscientiousness
-            weighted_votes[choice] += weight
+        # More careful = more weight, tallied across the panel in one pass
+        weights = trait_matrix([vote["agent"] for vote in votes])[:, TRAIT_NAMES.index("conscientiousness")]
+        weighted_votes = np.bincount(choice_index, weights=weights, minlength=len(options))
         
-        winner = max(weighted_votes, key=weighted_votes.get)
-        total_weight = sum(weighted_votes.values())
+        winner_index = int(np.argmax(weighted_votes))
+        winner = options[winner_index]
+        total_weight = float(weighted_votes.sum())
         
         return VotingResult(
             winner=winner,
-            vote_counts={k: int(v * 10) for k, v in weighted_votes.items()},  # Scale for display
+            vote_counts={option: int(weight * 10) for option, weight in zip(options, weighted_votes)},  # Scale for display
             total_votes=len(votes),
             consensus_type=ConsensusType.WEIGHTED,
             is_decisive=True,
             tied=False,
-            confidence=weighted_votes[winner] / total_weight,
+            confidence=float(weighted_votes[winner_index]) / total_weight,
             breakdown=breakdown
         )
 
@@ -359,4 +460,27 @@ def quick_vote(
             "question": question,
             "options": options
         }
-    )
\ No newline at end of file
+    )
+
+
+async def aquick_vote(
+    agents: List[Any],
+    question: str,
+    options: List[str],
+    consensus_type: ConsensusType = ConsensusType.SIMPLE_MAJORITY,
+    early_stop: bool = False
+) -> VotingResult:
+    """
+    Async quick_vote(); with early_stop, stops polling once the result is settled.
+    
+    Example:
+        result = await aquick_vote(agents, "Ship it?", ["Yes", "No"], early_stop=True)
+    """
+    protocol = VotingProtocol(consensus_type=consensus_type, early_stop=early_stop)
+    return await protocol.aexecute(
+        agents=agents,
+        context={
+            "question": question,
+            "options": options
+        }
+    )
@@ -22,7 +22,7 @@ from simulacrum.protocols.base import (
     ConsensusType,
     ProtocolState
 )
-from simulacrum.protocols.voting import VotingProtocol, quick_vote
+from simulacrum.protocols.voting import VotingProtocol, quick_vote, aquick_vote
 from simulacrum.protocols.jury import JuryProtocol, simulate_trial
 
 
@@ -109,6 +109,97 @@ class TestVotingProtocol:
         result2 = protocol._unanimous(votes2, 5, {})
         assert result2.is_decisive == False
     
+    def test_weighted_by_conscientiousness(self):
+        """Weighted voting should tally conscientiousness, not headcount"""
+        protocol = VotingProtocol(ConsensusType.WEIGHTED)
+        
+        adopters = [create_early_adopter(), create_early_adopter()]  # C=0.4 each
+        skeptic = create_skeptic()  # C=0.9
+        votes = [
+            {"choice": "Option A", "agent": adopters[0], "agent_id": "a1"},
+            {"choice": "Option A", "agent": adopters[1], "agent_id": "a2"},
+            {"choice": "Option B", "agent": skeptic, "agent_id": "s1"},
+        ]
+        result = protocol._weighted(votes, {})
+        
+        assert result.winner == "Option B"
+        assert result.vote_counts == {"Option A": 8, "Option B": 9}
+        assert result.confidence == pytest.approx(0.9 / 1.7)
+    
+    def test_votes_collected_in_one_batch(self, monkeypatch):
+        """A voting round should dispatch all agents in a single batched call"""
+        from simulacrum.core.llm import LLMEngine
+
+        calls = []
+
+        def fake_generate_batch(self, system_prompts, user_prompts, temperature=0.7):
+            calls.append(len(user_prompts))
+            return ["VOTE: 2\nREASON: Safer choice"] * len(user_prompts)
+
+        monkeypatch.setattr(LLMEngine, "generate_batch", fake_generate_batch)
+
+        agents = [create_early_adopter(), create_skeptic(), create_anxious_user()]
+        result = quick_vote(agents, "Proceed?", ["Yes", "No"])
+
+        assert calls == [3]
+        assert result.winner == "No"
+        assert all(len(agent.memory) == 1 for agent in agents)
+
+    def test_early_stop_cancels_outstanding_votes(self, monkeypatch):
+        """Once a simple majority is locked, slower agents should be cancelled"""
+        import asyncio
+        from simulacrum.core.llm import LLMEngine
+
+        async def fake_agenerate(self, system_prompt, user_prompt, temperature=0.7):
+            if "Charlie" in system_prompt:
+                await asyncio.sleep(5)
+            return "VOTE: 1\nREASON: Ship it"
+
+        monkeypatch.setattr(LLMEngine, "agenerate", fake_agenerate)
+
+        slow = create_anxious_user(name="Charlie")
+        agents = [create_early_adopter(name="Alex"), create_skeptic(name="Barbara"), slow]
+        result = asyncio.run(aquick_vote(agents, "Proceed?", ["Yes", "No"], early_stop=True))
+
+        assert result.winner == "Yes"
+        assert result.is_decisive
+        assert result.vote_counts == {"Yes": 2}
+        assert result.total_votes == 3
+        assert slow.memory == []
+
+    def test_sync_execute_rejects_early_stop(self):
+        """Early stopping needs an event loop, so only aexecute() offers it"""
+        protocol = VotingProtocol(early_stop=True)
+        
+        with pytest.raises(ValueError):
+            protocol.execute([create_early_adopter(), create_skeptic()], {"question": "Proceed?", "options": ["Yes", "No"]})
+
+    def test_consecutive_early_stop_votes_share_one_loop(self, monkeypatch):
+        """Back-to-back early-stop votes should run on the caller's loop, not nested ones"""
+        import asyncio
+        from simulacrum.core.llm import LLMEngine
+
+        loops = []
+
+        async def fake_agenerate(self, system_prompt, user_prompt, temperature=0.7):
+            loops.append(asyncio.get_running_loop())
+            return "VOTE: 1\nREASON: Ship it"
+
+        monkeypatch.setattr(LLMEngine, "agenerate", fake_agenerate)
+
+        async def two_votes():
+            results = []
+            for _ in range(2):
+                agents = [create_early_adopter(), create_skeptic(), create_anxious_user()]
+                results.append(await aquick_vote(agents, "Proceed?", ["Yes", "No"], early_stop=True))
+            return asyncio.get_running_loop(), results
+
+        outer_loop, results = asyncio.run(two_votes())
+
+        assert len(loops) >= 4  # At least a majority from each vote
+        assert all(loop is outer_loop for loop in loops)
+        assert all(result.winner == "Yes" and result.is_decisive for result in results)
+
     def test_tie_detection(self):
         """Should detect ties"""
         protocol = VotingProtocol(ConsensusType.SIMPLE_MAJORITY)
@@ -181,6 +272,49 @@ class TestJuryProtocol:
         votes2 = {"Guilty": 8, "Not Guilty": 4}
         assert protocol._check_consensus(votes2, 12) == False
 
+    def test_round_callback_streams_trajectory(self, monkeypatch):
+        """on_round_complete should fire once per round, as each round's votes come in"""
+        from simulacrum.core.llm import LLMEngine
+
+        # Split 3-3, then 4-2 (short of 75%), then unanimous
+        vote_rounds = [
+            ["Guilty"] * 3 + ["Not Guilty"] * 3,
+            ["Guilty"] * 2 + ["Not Guilty"] * 4,
+            ["Not Guilty"] * 6,
+        ]
+        vote_calls = []
+
+        def fake_generate_batch(self, system_prompts, user_prompts, temperature=0.7):
+            if user_prompts[0].startswith("CONTEXT: Jury deliberation argument"):
+                return ["The evidence leaves reasonable doubt."] * len(user_prompts)
+            votes = vote_rounds[len(vote_calls)]
+            vote_calls.append(votes)
+            return [f"VOTE: {vote}\nREASON: Considered the evidence" for vote in votes]
+
+        monkeypatch.setattr(LLMEngine, "generate_batch", fake_generate_batch)
+
+        rounds = []
+        verdict = simulate_trial(
+            agents=[create_skeptic(name=f"Juror{i}") for i in range(6)],
+            case_summary="Test case",
+            charges="Test charge",
+            evidence=[],
+            on_round_complete=lambda round_num, votes: rounds.append((round_num, votes, len(vote_calls))),
+            verbose=False
+        )
+
+        assert [round_num for round_num, _, _ in rounds] == [0, 1, 2]
+        assert [votes for _, votes, _ in rounds] == [
+            {"Guilty": 3, "Not Guilty": 3},
+            {"Guilty": 2, "Not Guilty": 4},
+            {"Not Guilty": 6},
+        ]
+        # Each callback fired right after its own round's votes, not at the end
+        assert [calls_so_far for _, _, calls_so_far in rounds] == [1, 2, 3]
+        assert verdict.rounds_taken == 2
+        assert verdict.verdict == "Not Guilty"
+        assert verdict.vote_trajectory == [votes for _, votes, _ in rounds]
+
 
 class TestQuickVote:
     """Test convenience functions"""
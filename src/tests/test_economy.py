@@ -0,0 +1,185 @@
+# tests/test_economy.py
+"""
+Unit tests for economic agents and marketplaces
+Run with: pytest tests/test_economy.py
+"""
+
+import pytest
+import sys
+import os
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '../src'))
+
+from simulacrum.agents.persona import PsychologicalProfile
+from simulacrum.economy.wallet import (
+    Wallet,
+    UtilityFunction,
+    calculate_utility,
+    calculate_utility_batch,
+    create_economic_citizen
+)
+from simulacrum.economy.marketplace import Marketplace, simulate_market
+
+
+CONTEXTS = [
+    {},
+    {"reviews": 80, "social_proof": 1.5},
+    {"novelty_bonus": 40, "risk_adjustment": -30, "quality_premium": 20},
+    {"network_value": 25, "reviews": 10, "social_proof": 0.8},
+]
+
+
+def _citizens(prefix: str, count: int, seed: int, balances=(1000.0,)):
+    """Economic citizens with random traits and cycling starting balances"""
+    rng = np.random.default_rng(seed)
+    citizens = []
+    for i in range(count):
+        o, c, e, a, n = np.round(rng.random(5), 2).tolist()
+        traits = PsychologicalProfile(
+            openness=o, conscientiousness=c, extraversion=e, agreeableness=a, neuroticism=n
+        )
+        citizens.append(create_economic_citizen(
+            f"{prefix}{i}", "Trader", traits, initial_balance=balances[i % len(balances)]
+        ))
+    return citizens
+
+
+def _direct_utility(agent, base_value, context):
+    """UtilityFunction.calculate, built the way calculate_utility always did"""
+    return UtilityFunction(
+        base_value=base_value,
+        risk_adjustment=context.get("risk_adjustment", 0),
+        novelty_bonus=context.get("novelty_bonus", 0),
+        social_proof_multiplier=context.get("social_proof", 1.0),
+        quality_premium=context.get("quality_premium", 0)
+    ).calculate(agent, context)
+
+
+def _direct_market(buyers, sellers, context):
+    """One buyer at a time, each listing valued with UtilityFunction directly"""
+    base_value = context.get("base_value", 100)
+    listings = []
+    for seller in sellers:
+        if seller.traits.openness > 0.7:
+            price = base_value * 1.3
+        elif seller.traits.neuroticism > 0.7:
+            price = base_value * 0.9
+        elif seller.traits.conscientiousness > 0.7:
+            price = base_value * 1.1
+        else:
+            price = base_value
+        listings.append((seller.name, price))
+
+    trades = []
+    balances = {b.name: b.wallet.balance for b in buyers}
+    for buyer in buyers:
+        affordable = sorted(
+            (l for l in listings if l[1] <= balances[buyer.name]),
+            key=lambda l: l[1]
+        )
+        best, best_surplus = None, -float("inf")
+        for listing in affordable:
+            value = _direct_utility(buyer, context.get("base_value", listing[1] * 1.2), context)
+            surplus = value - listing[1]
+            if surplus > 0 and surplus > best_surplus:
+                best, best_surplus = listing, surplus
+        if best:
+            listings.remove(best)
+            balances[buyer.name] -= best[1]
+            trades.append((buyer.name, best[0], best[1]))
+    return trades, balances
+
+
+class TestWallet:
+    """Test wallet history and aggregates"""
+
+    def test_aggregates_survive_round_trip(self):
+        """A wallet loaded from its dump should report the same purchases"""
+        wallet = Wallet(owner_id="Alex")
+        wallet.spend(120.0, counterparty="Shop", item="Widget")
+        wallet.receive(40.0, counterparty="Buyer", item="Gadget")
+        wallet.spend(30.0, counterparty="Shop", item="Gizmo")
+
+        for loaded in (
+            Wallet.model_validate(wallet.model_dump()),
+            Wallet.model_validate_json(wallet.model_dump_json()),
+            Wallet(owner_id="Alex", transactions=wallet.transactions),
+        ):
+            assert loaded.total_spent() == wallet.total_spent() == 150.0
+            assert [t.id for t in loaded.get_spending_history()] == ["tx_1", "tx_3"]
+
+            loaded.spend(10.0, counterparty="Shop", item="Widget")
+            assert loaded.total_spent() == 160.0
+            assert len(loaded.get_spending_history()) == 3
+
+
+class TestUtility:
+    """Test utility calculation"""
+
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_memoized_utility_matches_direct(self, context):
+        """calculate_utility should equal UtilityFunction.calculate, cached or not"""
+        for agent in _citizens("Agent", 8, seed=1):
+            expected = _direct_utility(agent, 120.0, context)
+            assert calculate_utility(agent, "Widget", 120.0, context) == expected
+            assert calculate_utility(agent, "Widget", 120.0, context) == expected  # Cache hit
+
+    def test_memoized_utility_follows_trait_changes(self):
+        """A changed trait should not reuse the cached value"""
+        agent = _citizens("Agent", 1, seed=2)[0]
+        context = {"novelty_bonus": 50}
+        calculate_utility(agent, "Widget", 100.0, context)
+
+        agent.traits.openness = 1.0 if agent.traits.openness < 1.0 else 0.0
+        assert calculate_utility(agent, "Widget", 100.0, context) == _direct_utility(agent, 100.0, context)
+
+    def test_unhashable_context_value(self):
+        """Unhashable context values should fall back to direct computation"""
+        agent = _citizens("Agent", 1, seed=3)[0]
+        context = {"reviews": 50, "social_proof": 1.2, "tags": ["new"]}
+        assert calculate_utility(agent, "Widget", 90.0, context) == _direct_utility(agent, 90.0, context)
+
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_batch_utility_matches_direct(self, context):
+        """calculate_utility_batch should match per-agent calculation"""
+        agents = _citizens("Agent", 12, seed=4)
+        expected = [_direct_utility(agent, 150.0, context) for agent in agents]
+        assert calculate_utility_batch(agents, "Widget", 150.0, context).tolist() == pytest.approx(expected)
+
+
+class TestMarketplace:
+    """Test market clearing"""
+
+    @pytest.mark.parametrize("context", CONTEXTS)
+    def test_simulate_market_matches_direct(self, context):
+        """simulate_market should clear the same trades as a buyer-by-buyer loop"""
+        buyers = _citizens("Buyer", 15, seed=5, balances=(1000.0, 95.0, 40.0))
+        sellers = _citizens("Seller", 10, seed=6)
+        trades, balances = _direct_market(buyers, sellers, {**context, "base_value": 100})
+
+        result = simulate_market(buyers, sellers, "Widget", base_value=100, context=context)
+
+        assert [(t.buyer_id, t.seller_id, t.price) for t in result.transactions] == trades
+        assert {b.name: b.wallet.balance for b in buyers} == balances
+        assert result.total_volume == len(trades)
+        if trades:
+            prices = [price for _, _, price in trades]
+            assert result.avg_price == pytest.approx(sum(prices) / len(prices))
+            assert result.price_range == (min(prices), max(prices))
+        assert result.unmatched_buyers == [
+            b.name for b in buyers if b.name not in {t[0] for t in trades}
+        ]
+        assert len(result.unsold_listings) == len(sellers) - len(trades)
+
+    def test_per_listing_valuation_matches_direct(self):
+        """Without a shared base value each listing should be valued from its own price"""
+        buyers = _citizens("Buyer", 12, seed=7, balances=(1000.0, 100.0))
+        sellers = _citizens("Seller", 8, seed=8)
+        context = {"novelty_bonus": 30, "risk_adjustment": -40}
+        trades, balances = _direct_market(buyers, sellers, context)
+
+        result = Marketplace().simulate_trading(buyers, sellers, "Widget", context)
+
+        assert [(t.buyer_id, t.seller_id, t.price) for t in result.transactions] == trades
+        assert {b.name: b.wallet.balance for b in buyers} == balances
@@ -69,6 +69,23 @@ class TestPsychologicalProfile:
         # Low conscientiousness
         interp = profile.get_trait_interpretation('conscientiousness')
         assert 'spontaneous' in interp.lower() or 'flexible' in interp.lower()
+    
+    def test_array_protocol(self):
+        """np.asarray should yield the traits in TRAIT_NAMES order"""
+        import numpy as np
+        
+        profile = PsychologicalProfile(
+            openness=0.9,
+            conscientiousness=0.2,
+            extraversion=0.4,
+            agreeableness=0.6,
+            neuroticism=0.5
+        )
+        vector = np.asarray(profile)
+        
+        assert vector.dtype == np.float64
+        assert vector.tolist() == [0.9, 0.2, 0.4, 0.6, 0.5]
+        assert PsychologicalProfile.from_vector(vector) == profile
 
 class TestCitizen:
     """Test the Citizen agent class"""
@@ -216,6 +233,70 @@ class TestCitizen:
         
         pricing_memories = citizen.recall("pricing")
         assert len(pricing_memories) == 1
+    
+    def test_memory_recall_tracks_memory_changes(self):
+        """Recall should match substrings and stay correct as memory changes"""
+        citizen = Citizen(
+            name="Taylor",
+            role="Customer",
+            traits=PsychologicalProfile(openness=0.5, conscientiousness=0.5, neuroticism=0.5)
+        )
+        
+        citizen.remember("Launches slipped again")
+        assert len(citizen.recall("launch")) == 1
+        assert len(citizen.recall("ed ag")) == 1
+        
+        citizen.memory.append(MemoryEntry(stimulus="Launch party", response="Fun"))
+        assert len(citizen.recall("LAUNCH")) == 2
+        
+        citizen.memory[0] = MemoryEntry(stimulus="Quiet week", response="Relaxing")
+        assert [m.stimulus for m in citizen.recall("launch")] == ["Launch party"]
+        
+        citizen.memory = []
+        assert citizen.recall("launch") == []
+
+    def test_memory_limit_keeps_most_recent(self):
+        """memory_limit should drop the oldest memories; lists are per-citizen"""
+        traits = PsychologicalProfile(openness=0.5, conscientiousness=0.5, neuroticism=0.5)
+        bounded = Citizen(name="Taylor", role="Customer", traits=traits, memory_limit=2)
+        other = Citizen(name="Sam", role="Customer", traits=traits)
+
+        for event in ["Launch one", "Launch two", "Launch three"]:
+            bounded.remember(event)
+
+        assert [m.stimulus for m in bounded.memory] == ["Launch two", "Launch three"]
+        assert len(bounded.recall("launch")) == 2
+        assert other.memory == [] and other.core_values == []
+
+    def test_shared_responses_deduplicated(self, monkeypatch):
+        """Identical sharing personas should cost one LLM call between them"""
+        from simulacrum.core.llm import LLMEngine
+        
+        calls = []
+        
+        def fake_generate_batch(self, system_prompts, user_prompts, temperature=0.7):
+            calls.append(len(user_prompts))
+            return [f"Answer {i}" for i in range(len(user_prompts))]
+        
+        monkeypatch.setattr(LLMEngine, "generate_batch", fake_generate_batch)
+        
+        traits = PsychologicalProfile(openness=0.5, conscientiousness=0.6, neuroticism=0.4)
+        twins = [
+            Citizen(name=f"Juror{i}", role="Juror", traits=traits.model_copy(), share_responses=True)
+            for i in range(3)
+        ]
+        loner = Citizen(name="Solo", role="Juror", traits=traits.model_copy())
+        stimulus = "Dedup check: is the defendant guilty?"
+        
+        responses = Citizen.batch_think([(c, stimulus, None) for c in twins + [loner]])
+        assert calls == [2]
+        assert responses == ["Answer 0", "Answer 0", "Answer 0", "Answer 1"]
+        assert all(len(c.memory) == 1 for c in twins)
+        
+        # A fresh identical persona is served from the cache
+        late = Citizen(name="Juror9", role="Juror", traits=traits.model_copy(), share_responses=True)
+        assert Citizen.batch_think([(late, stimulus, None)]) == ["Answer 0"]
+        assert calls == [2]
 
 class TestFactoryFunctions:
     """Test the archetype factory functions"""
@@ -313,6 +394,86 @@ class TestSystemPromptGeneration:
         prompt = citizen._build_system_prompt()
         assert "user experience" in prompt.lower()
         assert "accessibility" in prompt.lower()
+    
+    def test_prompt_shared_and_tracks_trait_changes(self):
+        """Identical personas share a prompt; trait drift yields a fresh one"""
+        alex = create_early_adopter(name="Alex")
+        twin = create_early_adopter(name="Alex")
+        
+        assert alex._build_system_prompt() is twin._build_system_prompt()
+        
+        alex.traits.openness = 0.1
+        prompt = alex._build_system_prompt()
+        assert "Openness: 0.1 (traditional" in prompt
+        assert "Openness: 0.9" in twin._build_system_prompt()
+
+class TestAsyncThinking:
+    """Test the async cognitive loop"""
+
+    def test_athink_stores_memory(self, monkeypatch):
+        """athink should return the LLM response and record it in memory"""
+        import asyncio
+        from simulacrum.core.llm import LLMEngine
+
+        async def fake_agenerate(self, system_prompt, user_prompt, temperature=0.7):
+            return f"Reaction to: {user_prompt.splitlines()[-3]}"
+
+        monkeypatch.setattr(LLMEngine, "agenerate", fake_agenerate)
+
+        citizens = [create_early_adopter(name="Alex"), create_skeptic(name="Barbara")]
+
+        async def react_all():
+            return await asyncio.gather(*[c.athink("New feature launch") for c in citizens])
+
+        reactions = asyncio.run(react_all())
+
+        assert reactions == ["Reaction to: New feature launch"] * 2
+        for citizen in citizens:
+            assert len(citizen.memory) == 1
+            assert citizen.memory[0].stimulus == "New feature launch"
+
+
+class TestBatchThinking:
+    """Test the batched cognitive round"""
+
+    def test_batch_retries_only_failed_prompts(self, monkeypatch):
+        """A transient failure should re-send only the prompts that failed"""
+        from types import SimpleNamespace
+        from tenacity import wait_none
+        import simulacrum.core.llm as llm
+
+        class RateLimitError(Exception):
+            pass
+
+        sent = []
+
+        def batch_completion(model, messages, temperature, safety_settings):
+            stimuli = [m[1]["content"].splitlines()[-3] for m in messages]
+            sent.append(stimuli)
+            return [
+                RateLimitError("slow down") if len(sent) == 1 and stimulus == "Price drop"
+                else SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=f" On {stimulus} "))])
+                for stimulus in stimuli
+            ]
+
+        fake_litellm = SimpleNamespace(
+            batch_completion=batch_completion,
+            RateLimitError=RateLimitError,
+            APIConnectionError=ConnectionError,
+            Timeout=TimeoutError
+        )
+        monkeypatch.setattr(llm, "_litellm", fake_litellm)
+        monkeypatch.setitem(llm._RETRY_POLICY, "wait", wait_none())
+
+        alex, barbara = create_early_adopter(name="Alex"), create_skeptic(name="Barbara")
+        responses = Citizen.batch_think([
+            (alex, "New feature launch", None),
+            (barbara, "Price drop", None)
+        ])
+
+        assert responses == ["On New feature launch", "On Price drop"]
+        assert sent == [["New feature launch", "Price drop"], ["Price drop"]]
+
 
 class TestMemoryEntry:
     """Test memory entry structure"""